@@ -1,4 +1,5 @@
 # workflow_engine/contexts/local.py
+import asyncio
 import json
 import os
 from typing import TypeVar
@@ -21,6 +22,16 @@ from ..core.values import dump_data_mapping, serialize_data_mapping
 F = TypeVar("F", bound=FileValue)
 
 
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _write_bytes(path: str, content: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(content)
+
+
 class LocalContext(Context):
     """
     A context that uses the local filesystem to store files.
@@ -95,8 +106,9 @@ class LocalContext(Context):
         if not os.path.exists(path):
             raise UserException(f"File {file.path} not found")
         try:
-            with open(path, "rb") as f:
-                return f.read()
+            # run the blocking I/O on a worker thread so that concurrent reads
+            # and writes (e.g. when casting several inputs) overlap
+            return await asyncio.to_thread(_read_bytes, path)
         except Exception as e:
             raise UserException(f"Failed to read file {file.path}") from e
 
@@ -109,8 +121,7 @@ class LocalContext(Context):
         path = self.get_file_path(file.path)
         os.makedirs(os.path.dirname(path), exist_ok=True)
         try:
-            with open(path, "wb") as f:
-                f.write(content)
+            await asyncio.to_thread(_write_bytes, path, content)
         except Exception as e:
             raise UserException(f"Failed to write file {file.path}") from e
         return file
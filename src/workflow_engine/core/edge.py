@@ -37,19 +37,23 @@ class Edge(ImmutableBaseModel):
         return edge
 
     def validate_types(self, source: Node, target: Node):
-        if self.source_key not in source.output_fields:
+        # these are recomputed on every access, so only read them once
+        source_output_fields = source.output_fields
+        target_input_fields = target.input_fields
+
+        if self.source_key not in source_output_fields:
             raise ValueError(
                 f"Source node {source.id} does not have a {self.source_key} field"
             )
 
-        if self.target_key not in target.input_fields:
+        if self.target_key not in target_input_fields:
             raise ValueError(
                 f"Target node {target.id} does not have a {self.target_key} field"
             )
 
-        source_output_type, _ = source.output_fields[self.source_key]
+        source_output_type, _ = source_output_fields[self.source_key]
         assert issubclass(source_output_type, Value)
-        target_input_type, _ = target.input_fields[self.target_key]
+        target_input_type, _ = target_input_fields[self.target_key]
         assert issubclass(target_input_type, Value)
 
         if not source_output_type.can_cast_to(target_input_type):
@@ -93,12 +97,13 @@ class InputEdge(ImmutableBaseModel):
         )
 
     def validate_types(self, input_type: ValueType, target: Node):
-        if self.target_key not in target.input_fields:
+        target_input_fields = target.input_fields
+        if self.target_key not in target_input_fields:
             raise ValueError(
                 f"Target node {target.id} does not have a {self.target_key} field"
             )
 
-        target_input_type, _ = target.input_fields[self.target_key]
+        target_input_type, _ = target_input_fields[self.target_key]
         assert issubclass(target_input_type, Value)
 
         if not input_type.can_cast_to(target_input_type):
@@ -55,7 +55,10 @@ class NodeExpansionException(UserException):
     """
 
     def __init__(self, node_id: str, workflow: "Workflow"):
-        super().__init__(f"Error expanding node {node_id} into the workflow {workflow}")
+        # message is a property here, so UserException.__init__ cannot set it
+        RuntimeError.__init__(
+            self, f"Error expanding node {node_id} into the workflow {workflow}"
+        )
         self.node_id = node_id
         self.workflow = workflow
 
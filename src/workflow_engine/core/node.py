@@ -7,7 +7,6 @@ from collections.abc import Mapping
 from functools import cached_property
 from typing import (
     TYPE_CHECKING,
-    Awaitable,
     ClassVar,
     Generic,
     Literal,
@@ -50,6 +49,7 @@ class Params(Data):
     model_config: ClassVar[ConfigDict] = ConfigDict(
         extra="allow",
         frozen=True,
+        defer_build=True,
     )
 
     # The base class has extra="allow", so that it can be deserialized into any
@@ -133,7 +133,9 @@ class Node(ImmutableBaseModel, Generic[Input_contra, Output_co, Params_co]):
     """
 
     # Allow extra fields, such as position or appearance information.
-    model_config: ClassVar[ConfigDict] = ConfigDict(extra="allow")
+    # Schema building is deferred until a node type is first validated, so that
+    # importing a module full of node types stays cheap.
+    model_config: ClassVar[ConfigDict] = ConfigDict(extra="allow", defer_build=True)
 
     # Must be annotated as ClassVar[NodeTypeInfo] when overriding.
     # Does not have a value here, since the base Node class is not meant to be
@@ -194,18 +196,30 @@ class Node(ImmutableBaseModel, Generic[Input_contra, Output_co, Params_co]):
         """
         Replaces the Node object with an instance of the registered subclass.
         """
+        node_cls = self.__class__
+        # Fast path: pydantic runs this validator on every instance, including
+        # the concrete subclass instances we dispatch to below, so check for
+        # those first.
+        if not _registry.is_base_class(node_cls):
+            if node_cls is Node:
+                warnings.warn(
+                    f"Node validation for node {self} could not find a registered subclass to dispatch to."
+                )
+            return self
+
         # HACK: This trick only works if the base class can be instantiated, so
         # we cannot make it an ABC even if it has unimplemented methods.
-        if _registry.is_base_class(self.__class__):
-            cls = _registry.get(self.type)
-            if cls is None:
-                raise ValueError(f'Node type "{self.type}" is not registered')
-            return cls.model_validate(self.model_dump())
-        if self.__class__ is Node:
-            warnings.warn(
-                f"Node validation for node {self} could not find a registered subclass to dispatch to."
-            )
-        return self
+        cls = _registry.get(self.type)
+        if cls is None:
+            raise ValueError(f'Node type "{self.type}" is not registered')
+        # None of the subclass's fields have been validated yet (params only
+        # went through the permissive base Params), so we cannot skip
+        # validation with model_construct. Only params needs to be dumped,
+        # though; the other fields and any extras are already plain data.
+        data = dict(self.__pydantic_extra__ or {})
+        data.update(self.__dict__)
+        data["params"] = self.params.model_dump()
+        return cls.model_validate(data)
 
     # --------------------------------------------------------------------------
     # NAMING
@@ -310,39 +324,34 @@ class Node(ImmutableBaseModel, Generic[Input_contra, Output_co, Params_co]):
         input: DataMapping,
         context: "Context",
     ) -> Input_contra:  # type: ignore (contravariant return type)
-        allow_extra_input = (
-            self.input_type.model_config.get("extra", "forbid") == "allow"
-        )
+        # input_type may build a new class on every access, so resolve it once
+        input_cls = self.input_type
+        allow_extra_input = input_cls.model_config.get("extra", "forbid") == "allow"
 
-        # Validate all inputs first
+        input_fields = self.input_fields
+
+        # Validate all inputs first, keeping track of the ones we need to cast
+        keys: list[str] = []
         for key, value in input.items():
-            if key not in self.input_fields and allow_extra_input:
+            if key not in input_fields and allow_extra_input:
                 continue
-            input_type, _ = self.input_fields[key]
+            input_type, _ = input_fields[key]
             if not value.can_cast_to(input_type):
                 raise UserException(
                     f"Input {value} for node {self.id} is invalid: {value} is not assignable to {input_type}"
                 )
-
-        # Cast all inputs in parallel
-        cast_tasks: list[Awaitable[Value]] = []
-        keys: list[str] = []
-        for key, value in input.items():
-            if key not in self.input_fields and allow_extra_input:
-                continue
-            input_type, _ = self.input_fields[key]  # type: ignore
-            cast_tasks.append(value.cast_to(input_type, context=context))
             keys.append(key)
 
-        casted_values = await asyncio.gather(*cast_tasks)
-
-        # Build the result dictionary
-        casted_input: dict[str, Value] = {}
-        for key, casted_value in zip(keys, casted_values):
-            casted_input[key] = casted_value
+        # Cast all inputs in parallel
+        casted_values = await asyncio.gather(
+            *(input[key].cast_to(input_fields[key][0], context=context) for key in keys)
+        )
+        casted_input: dict[str, Value] = dict(zip(keys, casted_values))
 
         try:
-            return self.input_type.model_validate(casted_input)
+            # Call the class's compiled validator directly, which is what
+            # model_validate and TypeAdapter both delegate to anyway.
+            return input_cls.__pydantic_validator__.validate_python(casted_input)
         except ValidationError as e:
             raise UserException(
                 f"Input {casted_input} for node {self.id} is invalid: {e}"
@@ -412,9 +421,11 @@ class Node(ImmutableBaseModel, Generic[Input_contra, Output_co, Params_co]):
 
 
 class NodeRegistry:
+    __slots__ = ("types", "base_classes")
+
     def __init__(self):
         self.types: dict[str, Type[Node]] = {}
-        self.base_classes: list[Type[Node]] = []
+        self.base_classes: set[Type[Node]] = set()
 
     def register(self, type: str, cls: Type[Node]):
         if type in self.types:
@@ -433,7 +444,7 @@ class NodeRegistry:
 
     def register_base(self, cls: Type[Node]):
         if cls not in self.base_classes:
-            self.base_classes.append(cls)
+            self.base_classes.add(cls)
             logger.info("Registering class %s as base node type", cls.__name__)
 
     def is_base_class(self, cls: Type[Node]) -> bool:
@@ -21,6 +21,9 @@ logger = logging.getLogger(__name__)
 class Data(ImmutableBaseModel):
     model_config: ClassVar[ConfigDict] = ConfigDict(extra="forbid")
 
+    # set per class by to_value_schema
+    _value_schema: ClassVar["ValueSchema"]
+
     def __init_subclass__(cls, **kwargs):
         """Ensure all fields in subclasses are Value types."""
         super().__init_subclass__(**kwargs)
@@ -41,9 +44,16 @@ class Data(ImmutableBaseModel):
 
     @classmethod
     def to_value_schema(cls) -> "ValueSchema":
-        from .schema import validate_value_schema  # avoid circular import
-
-        return validate_value_schema(cls.model_json_schema())
+        # The schema only depends on the class, so we cache it on the class
+        # itself instead of recomputing it for every node that uses it.
+        # Look in cls.__dict__ so that subclasses don't inherit the parent's.
+        schema = cls.__dict__.get("_value_schema")
+        if schema is None:
+            from .schema import validate_value_schema  # avoid circular import
+
+            schema = validate_value_schema(cls.model_json_schema())
+            cls._value_schema = schema
+        return schema
 
 
 type DataMapping = Mapping[str, Value]
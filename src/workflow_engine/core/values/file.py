@@ -1,5 +1,4 @@
 # workflow_engine/core/values/file.py
-from abc import ABC
 from collections.abc import Mapping
 from logging import getLogger
 from typing import TYPE_CHECKING, Any, ClassVar, Self
@@ -15,7 +14,7 @@ if TYPE_CHECKING:
 logger = getLogger(__name__)
 
 
-class File(ImmutableBaseModel, ABC):
+class File(ImmutableBaseModel):
     """
     A serializable reference to a file.
 
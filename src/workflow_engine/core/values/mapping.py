@@ -1,11 +1,10 @@
 # workflow_engine/core/values/mapping.py
 
-import asyncio
 from collections.abc import ItemsView, Iterator, KeysView, Mapping, ValuesView
 from typing import TYPE_CHECKING, Generic, Type, TypeVar
 
 from .primitives import StringValue
-from .value import Caster, Value, get_origin_and_args
+from .value import Caster, Value, _cast_all, get_origin_and_args
 
 if TYPE_CHECKING:
     from ..context import Context
@@ -62,7 +61,8 @@ def cast_string_map_to_string_map(
 
     assert source_origin is StringMapValue
     assert target_origin is StringMapValue
-    if not source_value_type.can_cast_to(target_value_type):
+    value_caster = source_value_type.get_caster(target_value_type)
+    if value_caster is None:
         return None
 
     async def _cast(
@@ -70,14 +70,14 @@ def cast_string_map_to_string_map(
         context: "Context",
     ) -> target_type:  # pyright: ignore[reportInvalidTypeForm]
         assert isinstance(value, StringMapValue)
-        # Cast all values in parallel
-        keys, values = zip(*value.items())
-        cast_tasks = [
-            v.cast_to(target_value_type, context=context)  # type: ignore
-            for v in values
-        ]
-        casted_values = await asyncio.gather(*cast_tasks)
-        return target_type(dict(zip(keys, casted_values)))  # type: ignore
+        casted_values = await _cast_all(
+            value.values(),
+            source_value_type,
+            target_value_type,
+            value_caster,
+            context=context,
+        )
+        return target_type(dict(zip(value.keys(), casted_values)))  # type: ignore
 
     return _cast
 
@@ -8,17 +8,23 @@ from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
 from functools import cached_property
-from typing import Any, ClassVar, Literal
+from typing import Annotated, Any, ClassVar, Literal
+from weakref import WeakValueDictionary
 
 from overrides import override
 from pydantic import (
     ConfigDict,
+    Discriminator,
     Field,
+    GetJsonSchemaHandler,
+    Tag,
     ValidationError,
     model_serializer,
     SerializerFunctionWrapHandler,
     model_validator,
 )
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import CoreSchema
 
 from ...utils.immutable import ImmutableBaseModel
 from .data import Data, DataValue, build_data_type
@@ -31,7 +37,7 @@ from .primitives import (
     StringValue,
 )
 from .sequence import SequenceValue
-from .value import Value, ValueType, value_type_registry
+from .value import Value, ValueType, parametrize, value_type_registry
 
 
 def merge_defs(
@@ -124,7 +130,25 @@ class BaseValueSchema(ImmutableBaseModel):
 
         References, if any, are resolved using self.defs first, then any
         extra_defs in order of decreasing precedence.
+
+        Without extra_defs, the result only depends on this (immutable) schema,
+        so it is built once and reused. Empty definition mappings cannot affect
+        the result, so they are dropped first: nested schemas are always given
+        their parents' defs, which are usually empty.
         """
+        extra_defs = tuple(defs for defs in extra_defs if defs)
+        if not extra_defs:
+            return self._value_cls
+        return self._resolve_value_cls(*extra_defs)
+
+    @cached_property
+    def _value_cls(self) -> ValueType:
+        return self._resolve_value_cls()
+
+    def _resolve_value_cls(
+        self,
+        *extra_defs: Mapping[str, ValueSchema],
+    ) -> ValueType:
         if self.title is not None and self.title in value_type_registry:
             return value_type_registry[self.title]
         return self.build_value_cls(*extra_defs)
@@ -210,7 +234,7 @@ class SequenceValueSchema(BaseValueSchema):
         *extra_defs: Mapping[str, ValueSchema],
     ) -> type[SequenceValue]:
         T = self.items.to_value_cls(self.defs, *extra_defs)
-        return SequenceValue[T]
+        return parametrize(SequenceValue, T)
 
 
 class StringMapValueSchema(BaseValueSchema):
@@ -223,10 +247,18 @@ class StringMapValueSchema(BaseValueSchema):
         *extra_defs: Mapping[str, ValueSchema],
     ) -> type[StringMapValue]:
         if self.additionalProperties is True:
-            return StringMapValue[Value]
+            return parametrize(StringMapValue, Value)
         else:
             V = self.additionalProperties.to_value_cls(self.defs, *extra_defs)
-            return StringMapValue[V]
+            return parametrize(StringMapValue, V)
+
+
+# Data types rebuilt by DataValueSchema, keyed by their name and fields in order.
+# Identical schemas then share a single Data class (and hence a single
+# DataValue[D] class and its caches) instead of each building its own.
+_data_cls_cache: WeakValueDictionary[
+    tuple[str, tuple[tuple[str, ValueType, bool], ...]], type[Data]
+] = WeakValueDictionary()
 
 
 class DataValueSchema(BaseValueSchema):
@@ -263,7 +295,15 @@ class DataValueSchema(BaseValueSchema):
             for k, v in self.properties.items()
         }
         assert self.title is not None
-        return build_data_type(self.title, properties)
+        key = (
+            self.title,
+            tuple((k, t, required) for k, (t, required) in properties.items()),
+        )
+        cls = _data_cls_cache.get(key)
+        if cls is None:
+            cls = build_data_type(self.title, properties)
+            _data_cls_cache[key] = cls
+        return cls
 
     @override
     def build_value_cls(
@@ -271,7 +311,7 @@ class DataValueSchema(BaseValueSchema):
         *extra_defs: Mapping[str, ValueSchema],
     ) -> type[DataValue]:
         D = self.build_data_cls(*extra_defs)
-        return DataValue[D]
+        return parametrize(DataValue, D)
 
 
 class UnionValueSchema(BaseValueSchema):
@@ -338,19 +378,89 @@ class ReferenceValueSchema(BaseValueSchema):
         raise KeyError(f"Schema definition for {self.id} not found")
 
 
-type ValueSchema = (
-    BooleanValueSchema
-    | DataValueSchema
-    | FloatValueSchema
-    | IntegerValueSchema
-    | NullValueSchema
-    | SequenceValueSchema
-    | StringMapValueSchema
-    | StringValueSchema
-    | UnionValueSchema
-    | ReferenceValueSchema  # must be handled second-to-last
-    | BaseValueSchema  # must be handled last, corresponds to the Any catch-all
-)
+_schema_tags_by_type: Mapping[str, str] = {
+    "array": "array",
+    "boolean": "boolean",
+    "integer": "integer",
+    "null": "null",
+    "number": "number",
+    "string": "string",
+}
+
+_schema_tags_by_cls: Mapping[type[BaseValueSchema], str] = {
+    BooleanValueSchema: "boolean",
+    DataValueSchema: "data",
+    FloatValueSchema: "number",
+    IntegerValueSchema: "integer",
+    NullValueSchema: "null",
+    SequenceValueSchema: "array",
+    StringMapValueSchema: "map",
+    StringValueSchema: "string",
+    UnionValueSchema: "union",
+    ReferenceValueSchema: "ref",
+    BaseValueSchema: "any",
+}
+
+
+def _value_schema_tag(data: Any) -> str | None:
+    """
+    Picks the ValueSchema variant for a piece of data, so that pydantic only
+    validates against that one variant instead of trying every one of them.
+    Mirrors the precedence of the plain union: references and unions are
+    recognized by their keys, objects with properties are Data, other objects
+    are string maps, and anything without a known type is the Any catch-all.
+    """
+    if isinstance(data, BaseValueSchema):
+        return _schema_tags_by_cls.get(type(data), "any")
+    if not isinstance(data, Mapping):
+        return None
+    if "$ref" in data or "ref" in data:
+        return "ref"
+    if "anyOf" in data:
+        return "union"
+    t = data.get("type")
+    if t == "object":
+        return "data" if "properties" in data else "map"
+    if isinstance(t, str):
+        return _schema_tags_by_type.get(t, "any")
+    return "any"
+
+
+class _AnyOfJsonSchema:
+    """
+    Pydantic renders discriminated unions as oneOf, which is not part of the
+    JSON Schema subset handled here. The variants are mutually exclusive, so we
+    render the union as anyOf instead, which UnionValueSchema understands.
+    """
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls,
+        core_schema: CoreSchema,
+        handler: GetJsonSchemaHandler,
+    ) -> JsonSchemaValue:
+        json_schema = handler(core_schema)
+        resolved = handler.resolve_ref_schema(json_schema)
+        if "oneOf" in resolved:
+            resolved["anyOf"] = resolved.pop("oneOf")
+        return json_schema
+
+
+type ValueSchema = Annotated[
+    Annotated[BooleanValueSchema, Tag("boolean")]
+    | Annotated[DataValueSchema, Tag("data")]
+    | Annotated[FloatValueSchema, Tag("number")]
+    | Annotated[IntegerValueSchema, Tag("integer")]
+    | Annotated[NullValueSchema, Tag("null")]
+    | Annotated[SequenceValueSchema, Tag("array")]
+    | Annotated[StringMapValueSchema, Tag("map")]
+    | Annotated[StringValueSchema, Tag("string")]
+    | Annotated[UnionValueSchema, Tag("union")]
+    | Annotated[ReferenceValueSchema, Tag("ref")]
+    | Annotated[BaseValueSchema, Tag("any")],  # the Any catch-all
+    Discriminator(_value_schema_tag),
+    _AnyOfJsonSchema,
+]
 
 
 # yep, this is possible
@@ -359,10 +469,17 @@ class ValueSchemaValue(Value[ValueSchema]):
 
 
 def validate_value_schema(schema: Any) -> ValueSchema:
+    """
+    Validates a schema given as a ValueSchema, a parsed JSON object, or raw JSON
+    text. Raw JSON is parsed and validated in a single pass by pydantic-core,
+    rather than going through json.loads first.
+    """
     # idempotent: if the schema is already a ValueSchema, just return it
     if isinstance(schema, BaseValueSchema):
         return schema
     try:
+        if isinstance(schema, (str, bytes)):
+            return ValueSchemaValue.model_validate_json(schema).root
         return ValueSchemaValue.model_validate(schema).root
     except ValidationError as e:
         raise ValueError(f"Invalid value schema: {schema}") from e
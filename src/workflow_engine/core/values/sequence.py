@@ -1,11 +1,10 @@
 # workflow_engine/core/values/sequence.py
 
-import asyncio
-from collections.abc import Iterator, Sequence
+from collections.abc import Callable, Iterator, Sequence
 from typing import TYPE_CHECKING, Any, Generic, Type, TypeVar
 
-from .primitives import IntegerValue
-from .value import Caster, Value, get_origin_and_args
+from .primitives import FloatValue, IntegerValue
+from .value import Caster, Value, ValueType, _cast_all, get_origin_and_args
 
 if TYPE_CHECKING:
     from ..context import Context
@@ -28,13 +27,45 @@ class SequenceValue(Value[Sequence[T]], Generic[T]):
         yield from self.root
 
     def __contains__(self, item: Any) -> bool:
-        return any(x == item for x in self.root)
+        # Values compare equal to their raw contents, so unwrapping the item
+        # lets the underlying sequence do the search itself. Each comparison
+        # still calls Value.__eq__ on the stored items.
+        if isinstance(item, Value):
+            item = item.root
+        return item in self.root
 
 
 SourceType = TypeVar("SourceType", bound=Value)
 TargetType = TypeVar("TargetType", bound=Value)
 
 
+# Synchronous casters that convert a whole sequence of items at once, keyed by
+# (source item type, target item type).
+# For cheap scalar casts, the overhead of creating and gathering one coroutine
+# per item is much larger than the cast itself.
+_bulk_casters: dict[
+    tuple[ValueType, ValueType], Callable[[Sequence[Any]], list[Any]]
+] = {}
+
+
+def _bulk_cast_integer_to_float(items: Sequence[IntegerValue]) -> list[FloatValue]:
+    return [FloatValue(float(x.root)) for x in items]
+
+
+def _bulk_cast_float_to_integer(items: Sequence[FloatValue]) -> list[IntegerValue]:
+    result: list[IntegerValue] = []
+    for x in items:
+        # same rule as cast_float_to_integer
+        if not x.root.is_integer():
+            raise ValueError(f"Cannot convert {x} to {IntegerValue}")
+        result.append(IntegerValue(int(x.root)))
+    return result
+
+
+_bulk_casters[IntegerValue, FloatValue] = _bulk_cast_integer_to_float
+_bulk_casters[FloatValue, IntegerValue] = _bulk_cast_float_to_integer
+
+
 @SequenceValue.register_generic_cast_to(SequenceValue)
 def cast_sequence_to_sequence(
     source_type: Type[SequenceValue[SourceType]],
@@ -45,19 +76,32 @@ def cast_sequence_to_sequence(
 
     assert source_origin is SequenceValue
     assert target_origin is SequenceValue
-    if not source_item_type.can_cast_to(target_item_type):
+    item_caster = source_item_type.get_caster(target_item_type)
+    if item_caster is None:
         return None
 
+    bulk_cast = _bulk_casters.get((source_item_type, target_item_type))
+    if bulk_cast is not None:
+
+        def _bulk_cast(
+            value: source_type,  # pyright: ignore[reportInvalidTypeForm]
+            context: "Context",
+        ) -> target_type:  # pyright: ignore[reportInvalidTypeForm]
+            return target_type(bulk_cast(value.root))  # type: ignore
+
+        return _bulk_cast
+
     async def _cast(
         value: source_type,  # pyright: ignore[reportInvalidTypeForm]
         context: "Context",
     ) -> target_type:  # pyright: ignore[reportInvalidTypeForm]
-        # Cast all items in parallel
-        cast_tasks = [
-            x.cast_to(target_item_type, context=context)  # type: ignore
-            for x in value.root
-        ]
-        casted_items = await asyncio.gather(*cast_tasks)
+        casted_items = await _cast_all(
+            value.root,
+            source_item_type,
+            target_item_type,
+            item_caster,
+            context=context,
+        )
         return target_type(casted_items)  # type: ignore
 
     return _cast
@@ -1,9 +1,13 @@
 # workflow_engine/core/values/value.py
+import asyncio
 import inspect
 import re
+from collections.abc import Iterable, Mapping
 from functools import cached_property
 from hashlib import md5
 from logging import getLogger
+from types import MappingProxyType
+from weakref import WeakValueDictionary
 from typing import (
     TYPE_CHECKING,
     Awaitable,
@@ -16,8 +20,6 @@ from typing import (
     get_origin,
 )
 
-from pydantic import PrivateAttr
-
 from ...utils.immutable import ImmutableRootModel
 
 if TYPE_CHECKING:
@@ -40,7 +42,14 @@ def get_origin_and_args(t: ValueType) -> tuple[ValueType, tuple[ValueType, ...]]
     For a generic value type GenericValue[Argument1Value, Argument2Value, ...],
     returns (GenericValue, (Argument1Value, Argument2Value, ...)).
     All arguments must themselves be Value subclasses.
+
+    The result never changes for a given class, so it is cached on the class
+    itself (in its own __dict__, so that subclasses don't inherit it).
     """
+    cached = t.__dict__.get("_origin_and_args")
+    if cached is not None:
+        return cached
+
     # Pydantic RootModels don't play nice with get_origin and get_args, so we
     # get the root type directly from the model fields.
     assert issubclass(t, Value)
@@ -49,11 +58,13 @@ def get_origin_and_args(t: ValueType) -> tuple[ValueType, tuple[ValueType, ...]]
     args = info["args"]
     if origin is None:
         assert len(args) == 0
-        return t, ()
+        result = t, ()
     else:
         assert issubclass(origin, Value)
         assert len(args) > 0
-        return origin, tuple(args)
+        result = origin, tuple(args)
+    t._origin_and_args = result
+    return result
 
 
 type ValueTypeKey = tuple[str, tuple[ValueTypeKey, ...]]
@@ -64,11 +75,44 @@ def get_value_type_key(t: ValueType) -> ValueTypeKey:
     Get a unique hashable key for a Value type.
     If t is a generic type, recursively call `get_value_type_key` to expand any
     Value types in the args.
+
+    Like get_origin_and_args, the key is cached on the class itself.
     """
+    cached = t.__dict__.get("_value_type_key")
+    if cached is not None:
+        return cached
+
     origin, args = get_origin_and_args(t)
-    return origin.__name__, tuple(
-        get_value_type_key(arg) if issubclass(arg, Value) else arg for arg in args
+    key = (
+        origin.__name__,
+        tuple(
+            get_value_type_key(arg) if issubclass(arg, Value) else arg for arg in args
+        ),
     )
+    t._value_type_key = key
+    return key
+
+
+_parametrized_cache: "WeakValueDictionary[tuple[ValueType, type], ValueType]" = (
+    WeakValueDictionary()
+)
+
+
+def parametrize(origin: Type[V], arg: type) -> Type[V]:
+    """
+    Returns the generic value type origin[arg], e.g. SequenceValue[IntegerValue].
+
+    Pydantic already caches generic parametrizations, but looking one up goes
+    through the typing machinery every time, which is much slower than a dict
+    lookup. We key on the classes themselves rather than on their names, since
+    dynamically built Data types can share a name.
+    """
+    key = (origin, arg)
+    cls = _parametrized_cache.get(key)
+    if cls is None:
+        cls = origin[arg]  # type: ignore
+        _parametrized_cache[key] = cls
+    return cls  # type: ignore
 
 
 SourceType = TypeVar("SourceType", bound="Value")
@@ -108,6 +152,10 @@ class GenericCaster(Protocol, Generic[SourceType, TargetType]):  # type: ignore
     ) -> Caster[SourceType, TargetType] | None: ...
 
 
+def _identity_caster(value: "Value", context: "Context") -> "Value":
+    return value
+
+
 generic_pattern = re.compile(r"^[a-zA-Z]\w+\[.*\]$")
 
 
@@ -128,11 +176,26 @@ class Value(ImmutableRootModel[T], Generic[T]):
     """
 
     # these properties force us to implement __eq__ and __hash__ to ignore them
-    _casters: ClassVar[dict[str, GenericCaster]] = {}
-    _resolved_casters: ClassVar[dict[str, GenericCaster] | None] = None
-    _cast_cache: dict[ValueTypeKey, "Value"] = PrivateAttr(
-        default_factory=dict,
-    )
+    # casters are keyed by the (origin) class of their target type
+    _casters: ClassVar[dict[ValueType, GenericCaster]] = {}
+    _resolved_casters: ClassVar[Mapping[ValueType, GenericCaster] | None] = None
+    # set once this class's casters have been merged into any resolved casters
+    _casters_locked: ClassVar[bool] = False
+    # set per class by get_origin_and_args and get_value_type_key
+    _origin_and_args: ClassVar[tuple[ValueType, tuple[ValueType, ...]]]
+    _value_type_key: ClassVar[ValueTypeKey]
+    # realized casters (or None if impossible) by target type
+    _caster_cache: ClassVar[dict[ValueTypeKey, Caster | None]] = {}
+
+    # The cast cache lives in slots rather than a PrivateAttr: any private
+    # attribute makes pydantic allocate a __pydantic_private__ dict for every
+    # instance, which adds up for large sequences of small values.
+    # Most values are cast to at most one other type, so the first cast is kept
+    # in _cast_key/_cast_value, and the _cast_cache dict is only allocated for
+    # any further ones. The slots stay empty until they are needed.
+    # (They must not be annotated, or pydantic would make them private
+    # attributes.)
+    __slots__ = ("_cast_key", "_cast_value", "_cast_cache")
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -140,6 +203,8 @@ class Value(ImmutableRootModel[T], Generic[T]):
         # reinitialize for each subclass so it doesn't just reference the parent
         cls._casters = {}
         cls._resolved_casters = None
+        cls._casters_locked = False
+        cls._caster_cache = {}
 
         # NOTE: something about this hack does not work when using
         # `from __future__ import annotations`.
@@ -150,7 +215,7 @@ class Value(ImmutableRootModel[T], Generic[T]):
             value_type_registry.register(cls.__name__, cls)
 
     @classmethod
-    def _get_casters(cls) -> dict[str, GenericCaster]:
+    def _get_casters(cls) -> Mapping[ValueType, GenericCaster]:
         """
         Get all type casting functions for this class, including those inherited
         from parent classes.
@@ -160,24 +225,21 @@ class Value(ImmutableRootModel[T], Generic[T]):
         if cls._resolved_casters is not None:
             return cls._resolved_casters
 
-        resolved_casters: dict[str, GenericCaster] = cls._casters.copy()
-
-        # Add converters from all classes in MRO order
-        # (starting from this class, then parents, then parents of parents, ...)
-        for parent in cls.__bases__:
-            if issubclass(parent, Value):
-                parent_casters = parent._get_casters()
-            else:
-                continue
-
-            for origin, caster in parent_casters.items():
-                # converters in the child class override those in the parent
-                # class
-                if origin not in resolved_casters:
-                    resolved_casters[origin] = caster
-
-        cls._resolved_casters = resolved_casters
-        return resolved_casters
+        # Merge the casters of every class in the MRO in a single pass, starting
+        # from the most distant ancestor, so that converters in subclasses
+        # override those in their parents.
+        # Every class merged here is locked, since adding casters to it later
+        # would not be reflected in this class's resolved casters.
+        resolved_casters: dict[ValueType, GenericCaster] = {}
+        for klass in reversed(cls.__mro__):
+            casters = klass.__dict__.get("_casters")
+            if casters is not None and issubclass(klass, Value):
+                resolved_casters.update(casters)
+                klass._casters_locked = True
+
+        # the merged casters can never change, so hand out a read-only view
+        cls._resolved_casters = MappingProxyType(resolved_casters)
+        return cls._resolved_casters
 
     @classmethod
     def register_cast_to(cls, t: Type[V]):
@@ -200,33 +262,52 @@ class Value(ImmutableRootModel[T], Generic[T]):
         """
 
         def wrap(caster: GenericCaster[Self, V]):
-            if cls._resolved_casters is not None:
+            if cls._casters_locked:
                 raise RuntimeError(
                     f"Cannot add casters for {cls.__name__} after it has been used to cast values"
                 )
 
             target_origin, _ = get_origin_and_args(t)
-            name = target_origin.__name__
-            if name in cls._casters:
+            if target_origin in cls._casters:
                 raise AssertionError(
-                    f"Type caster from {cls.__name__} to {name} already registered"
+                    f"Type caster from {cls.__name__} to {target_origin.__name__} already registered"
                 )
-            cls._casters[name] = caster
+            cls._casters[target_origin] = caster
 
         return wrap
 
     @classmethod
     def get_caster(cls, t: Type[V]) -> Caster[Self, V] | None:
+        """
+        Get a caster from this class to the type t, or None if the cast is not
+        possible.
+        Since the casters are locked once resolved, the result for each target
+        type is cached on the class.
+        """
+        if cls is t:
+            return _identity_caster  # type: ignore
+
+        key = get_value_type_key(t)
+        try:
+            return cls._caster_cache[key]
+        except KeyError:
+            pass
+        caster = cls._resolve_caster(t)
+        cls._caster_cache[key] = caster
+        return caster
+
+    @classmethod
+    def _resolve_caster(cls, t: Type[V]) -> Caster[Self, V] | None:
         converters = cls._get_casters()
         target_origin, _ = get_origin_and_args(t)
-        if target_origin.__name__ in converters:
-            generic_caster = converters[target_origin.__name__]
+        generic_caster = converters.get(target_origin)
+        if generic_caster is not None:
             caster = generic_caster(cls, t)
             if caster is not None:
                 return caster
 
         if issubclass(cls, t):
-            return lambda value, context: value  # type: ignore
+            return _identity_caster  # type: ignore
 
         return None
 
@@ -238,7 +319,9 @@ class Value(ImmutableRootModel[T], Generic[T]):
         return cls.get_caster(t) is not None
 
     def __eq__(self, other) -> bool:
-        if isinstance(other, Value):
+        # comparing two values of the same class is by far the most common
+        # case, and checking the exact type is cheaper than isinstance
+        if type(other) is type(self) or isinstance(other, Value):
             return self.root == other.root
         return self.root == other
 
@@ -256,19 +339,44 @@ class Value(ImmutableRootModel[T], Generic[T]):
 
     @cached_property
     def md5(self) -> str:
-        return md5(str(self).encode()).hexdigest()
+        """
+        A content hash of this value, used to name files derived from it.
+
+        The digest is part of the on-disk layout (e.g. `<md5>.json`), so it must
+        stay stable; it is not used for security.
+        """
+        return md5(str(self).encode(), usedforsecurity=False).hexdigest()
 
     async def cast_to(self, t: Type[V], *, context: "Context") -> V:
+        # casting to the exact same type is a no-op, and very common since
+        # inputs are usually already of the declared type
+        if self.__class__ is t:
+            return self  # type: ignore
+
+        # type keys are memoized per class, so they can be compared by identity
         key = get_value_type_key(t)
-        if key in self._cast_cache:
-            casted: V = self._cast_cache[key]  # type: ignore
-            return casted
+        cached_key = getattr(self, "_cast_key", None)
+        if cached_key is key:
+            return self._cast_value  # type: ignore
+        cache: dict[ValueTypeKey, Value] | None = None
+        if cached_key is not None:
+            cache = getattr(self, "_cast_cache", None)
+            if cache is not None and key in cache:
+                return cache[key]  # type: ignore
 
         cast_fn = self.__class__.get_caster(t)
         if cast_fn is not None:
             result = cast_fn(self, context)
             casted: V = (await result) if inspect.iscoroutine(result) else result  # type: ignore
-            self._cast_cache[key] = casted
+            # the slots are not pydantic attributes, so skip BaseModel.__setattr__
+            if cached_key is None:
+                object.__setattr__(self, "_cast_key", key)
+                object.__setattr__(self, "_cast_value", casted)
+            else:
+                if cache is None:
+                    cache = {}
+                    object.__setattr__(self, "_cast_cache", cache)
+                cache[key] = casted
             return casted
 
         raise ValueError(f"Cannot convert {self} to {t}")
@@ -284,6 +392,37 @@ class Value(ImmutableRootModel[T], Generic[T]):
         return validate_value_schema(cls.model_json_schema())
 
 
+async def _cast_all(
+    values: Iterable[Value],
+    source_type: ValueType,
+    target_type: Type[V],
+    caster: Caster,
+    *,
+    context: "Context",
+) -> list[V]:
+    """
+    Casts a collection of values declared as source_type to target_type, for
+    use in the casters of container types.
+
+    The caster from source_type to target_type is resolved once by the caller,
+    and applied directly to every value of exactly that type. Other values (of
+    subclasses, which may have their own casters) go through cast_to.
+    Asynchronous casts are run concurrently.
+    """
+    results: list = [
+        caster(value, context)
+        if type(value) is source_type
+        else value.cast_to(target_type, context=context)
+        for value in values
+    ]
+    pending = [i for i, result in enumerate(results) if inspect.iscoroutine(result)]
+    if len(pending) > 0:
+        done = await asyncio.gather(*(results[i] for i in pending))
+        for i, result in zip(pending, done):
+            results[i] = result
+    return results
+
+
 class ValueRegistry:
     def __init__(self):
         self.types: dict[str, ValueType] = {}
@@ -314,6 +453,7 @@ __all__ = [
     "Caster",
     "GenericCaster",
     "get_origin_and_args",
+    "parametrize",
     "Value",
     "ValueType",
     "value_type_registry",
@@ -1,11 +1,16 @@
 # workflow_engine/core/workflow.py
 from collections.abc import Mapping, Sequence
 from functools import cached_property
-from itertools import chain
 from typing import Type
 
 import networkx as nx
-from pydantic import ConfigDict, ValidationError, model_validator
+from pydantic import (
+    ConfigDict,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    field_validator,
+    model_validator,
+)
 
 from ..utils.immutable import ImmutableBaseModel
 from .edge import Edge, InputEdge, OutputEdge
@@ -14,6 +19,20 @@ from .node import Node
 from .values import Data, DataMapping, Value, ValueType, build_data_type
 
 
+# Validation context key for a collection of edges that are already known to
+# connect compatible types, e.g. because they were taken from another valid
+# workflow, so that _validate_edges can skip checking them again.
+_TYPE_CHECKED_EDGES = "type_checked_edges"
+
+# the type of the items of each of Workflow's sequence fields
+_item_types: Mapping[str, type] = {
+    "nodes": Node,
+    "edges": Edge,
+    "input_edges": InputEdge,
+    "output_edges": OutputEdge,
+}
+
+
 class Workflow(ImmutableBaseModel):
     model_config = ConfigDict(frozen=True)
 
@@ -22,6 +41,32 @@ class Workflow(ImmutableBaseModel):
     input_edges: Sequence[InputEdge]
     output_edges: Sequence[OutputEdge]
 
+    @field_validator("nodes", "edges", "input_edges", "output_edges", mode="wrap")
+    @classmethod
+    def _keep_validated_items(
+        cls,
+        value: object,
+        handler: ValidatorFunctionWrapHandler,
+        info: ValidationInfo,
+    ):
+        """
+        Nodes and edges are immutable, so instances that already exist (e.g.
+        those of another workflow, when it is namespaced or expanded) are kept
+        as they are, instead of being revalidated and, for nodes, dispatched to
+        their subclass all over again.
+        Anything else, such as raw data or plain Node objects that still need
+        to be dispatched to their subclass, is validated as usual.
+        Either way, the items are stored in a tuple.
+        """
+        if isinstance(value, (list, tuple)):
+            assert info.field_name is not None
+            item_type = _item_types[info.field_name]
+            if all(
+                isinstance(item, item_type) and type(item) is not Node for item in value
+            ):
+                return tuple(value)
+        return tuple(handler(value))
+
     @cached_property
     def nodes_by_id(self) -> Mapping[str, Node]:
         nodes_by_id: dict[str, Node] = {}
@@ -31,38 +76,148 @@ class Workflow(ImmutableBaseModel):
             nodes_by_id[node.id] = node
         return nodes_by_id
 
+    def _index_edges(self) -> None:
+        """
+        Builds edges_by_target, edge_plan and dependents in a single pass over
+        the edges, and stores all three where their cached properties keep
+        their values.
+        """
+        edges_by_target: dict[str, dict[str, Edge | InputEdge]] = {}
+        plan: dict[str, list[tuple[str, bool, str, str | None]]] = {}
+        dependents: dict[str, list[tuple[str, str, str]]] = {}
+        # The edges' copies of the node IDs are equal to, but usually not the
+        # same objects as, the nodes' own. Using the nodes' IDs throughout lets
+        # lookups in the (node ID-keyed) scheduling dicts hit on identity
+        # instead of comparing strings.
+        node_ids: dict[str, str] = {}
+        for node in self.nodes:
+            node_id = node.id
+            node_ids[node_id] = node_id
+            edges_by_target[node_id] = {}
+            plan[node_id] = []
+            dependents[node_id] = []
+
+        # Edges and input edges are already kept apart, so there is no need to
+        # check the type of each edge.
+        for edge in self.edges:
+            source_id = node_ids[edge.source_id]
+            target_id = node_ids[edge.target_id]
+            target_edges = edges_by_target[target_id]
+            if edge.target_key in target_edges:
+                raise ValueError(
+                    f"In-edge to {target_id}.{edge.target_key} is already in the graph"
+                )
+            target_edges[edge.target_key] = edge
+            plan[target_id].append((edge.target_key, False, source_id, edge.source_key))
+            dependents[source_id].append((target_id, edge.target_key, edge.source_key))
+        for input_edge in self.input_edges:
+            target_id = node_ids[input_edge.target_id]
+            target_edges = edges_by_target[target_id]
+            if input_edge.target_key in target_edges:
+                raise ValueError(
+                    f"In-edge to {target_id}.{input_edge.target_key} is already in the graph"
+                )
+            target_edges[input_edge.target_key] = input_edge
+            plan[target_id].append(
+                (input_edge.target_key, True, input_edge.input_key, None)
+            )
+
+        # the model is frozen, so bypass its __setattr__ to fill in the cached
+        # properties, as Value does for its cast cache
+        object.__setattr__(self, "edges_by_target", edges_by_target)
+        object.__setattr__(
+            self,
+            "edge_plan",
+            {node_id: tuple(entries) for node_id, entries in plan.items()},
+        )
+        object.__setattr__(
+            self,
+            "dependents",
+            {node_id: tuple(targets) for node_id, targets in dependents.items()},
+        )
+
     @cached_property
     def edges_by_target(self) -> Mapping[str, Mapping[str, Edge | InputEdge]]:
         """
         A mapping from each node and input key to the (unique) edge that targets
         the node at that key.
         """
-        edges_by_target: dict[str, dict[str, Edge | InputEdge]] = {
-            node.id: {} for node in self.nodes
+        self._index_edges()
+        return self.__dict__["edges_by_target"]
+
+    @cached_property
+    def edge_plan(self) -> Mapping[str, Sequence[tuple[str, bool, str, str | None]]]:
+        """
+        For each node, its in-edges flattened into
+        (target_key, is_input, source, source_key) tuples.
+        For input edges, source is the workflow input key and source_key is
+        None; otherwise, they are the source node's ID and output key.
+
+        The graph is immutable, so get_ready_nodes can use this instead of
+        inspecting every edge each time it is called.
+        """
+        self._index_edges()
+        return self.__dict__["edge_plan"]
+
+    @cached_property
+    def dependents(self) -> Mapping[str, Sequence[tuple[str, str, str]]]:
+        """
+        For each node, the edges leaving it as (target_id, target_key,
+        source_key) tuples.
+        """
+        self._index_edges()
+        return self.__dict__["dependents"]
+
+    @cached_property
+    def output_plan(self) -> Sequence[tuple[str, str, str]]:
+        """
+        The output edges flattened into (source_id, source_key, output_key)
+        tuples, for get_output.
+        """
+        return tuple(
+            (edge.source_id, edge.source_key, edge.output_key)
+            for edge in self.output_edges
+        )
+
+    @cached_property
+    def in_degrees(self) -> Mapping[str, int]:
+        """
+        For each node, the number of edges from other nodes that target it.
+        """
+        return {
+            node_id: sum(not is_input for _, is_input, _, _ in entries)
+            for node_id, entries in self.edge_plan.items()
         }
-        for edge in chain(self.edges, self.input_edges):
-            if edge.target_key in edges_by_target[edge.target_id]:
-                raise ValueError(
-                    f"In-edge to {edge.target_id}.{edge.target_key} is already in the graph"
-                )
-            edges_by_target[edge.target_id][edge.target_key] = edge
-        return edges_by_target
+
+    @cached_property
+    def node_input_fields(self) -> Mapping[str, Mapping[str, tuple[ValueType, bool]]]:
+        """
+        The input fields of each node.
+        Node.input_fields is recomputed on every access, so the workflow reads
+        it once per node and shares the result.
+        """
+        return {node.id: node.input_fields for node in self.nodes}
+
+    @cached_property
+    def node_output_fields(self) -> Mapping[str, Mapping[str, tuple[ValueType, bool]]]:
+        """
+        The output fields of each node, like node_input_fields.
+        """
+        return {node.id: node.output_fields for node in self.nodes}
 
     @cached_property
     def input_fields(self) -> Mapping[str, tuple[ValueType, bool]]:
+        node_input_fields = self.node_input_fields
         return {
-            edge.input_key: self.nodes_by_id[edge.target_id].input_fields[
-                edge.target_key
-            ]
+            edge.input_key: node_input_fields[edge.target_id][edge.target_key]
             for edge in self.input_edges
         }
 
     @cached_property
     def output_fields(self) -> Mapping[str, tuple[ValueType, bool]]:
+        node_output_fields = self.node_output_fields
         return {
-            edge.output_key: self.nodes_by_id[edge.source_id].output_fields[
-                edge.source_key
-            ]
+            edge.output_key: node_output_fields[edge.source_id][edge.source_key]
             for edge in self.output_edges
         }
 
@@ -111,15 +266,21 @@ class Workflow(ImmutableBaseModel):
     @model_validator(mode="after")
     def _validate_nodes(self):
         # make sure that for each node, all input edges are present
+        node_input_fields = self.node_input_fields
         for node in self.nodes:
-            for key, (_, required) in node.input_fields.items():
+            for key, (_, required) in node_input_fields[node.id].items():
                 if required and key not in self.edges_by_target[node.id]:
                     raise ValueError(f"Node {node.id} has no required input edge {key}")
         return self
 
     @model_validator(mode="after")
-    def _validate_edges(self):
+    def _validate_edges(self, info: ValidationInfo):
+        checked_edges = (
+            info.context.get(_TYPE_CHECKED_EDGES, ()) if info.context else ()
+        )
         for edge in self.edges:
+            if edge in checked_edges:
+                continue
             edge.validate_types(
                 source=self.nodes_by_id[edge.source_id],
                 target=self.nodes_by_id[edge.target_id],
@@ -128,7 +289,20 @@ class Workflow(ImmutableBaseModel):
 
     @model_validator(mode="after")
     def _validate_dag(self):
-        if not nx.is_directed_acyclic_graph(self.nx_graph):
+        # Kahn's algorithm over the precomputed indices; only fall back to
+        # networkx to report the cycles once we know there are some.
+        remaining = dict(self.in_degrees)
+        dependents = self.dependents
+        stack = [node_id for node_id, count in remaining.items() if count == 0]
+        visited = 0
+        while stack:
+            node_id = stack.pop()
+            visited += 1
+            for target_id, _, _ in dependents[node_id]:
+                remaining[target_id] -= 1
+                if remaining[target_id] == 0:
+                    stack.append(target_id)
+        if visited < len(remaining):
             cycles = list(nx.simple_cycles(self.nx_graph))
             raise ValueError(f"Workflow graph is not a DAG. Cycles found: {cycles}")
         return self
@@ -141,18 +315,21 @@ class Workflow(ImmutableBaseModel):
         This prevents ID collisions when composite nodes are expanded.
         For example, this prevents having both 'foo' and 'foo/bar' nodes.
         """
-        node_ids = [node.id for node in self.nodes]
-        sorted_ids = sorted(node_ids)
-
-        for i in range(len(sorted_ids) - 1):
-            current = sorted_ids[i]
-            next_id = sorted_ids[i + 1]
-            if next_id.startswith(current + "/"):
-                raise ValueError(
-                    f"Node ID collision detected: '{current}' is a prefix of '{next_id}'. "
-                    f"This would cause conflicts when composite nodes are expanded. "
-                    f"Please ensure no node ID is a prefix of another when followed by '/'."
-                )
+        # Rather than sorting and comparing neighbours (which misses 'foo' vs
+        # 'foo/bar' when 'foo-x' sorts between them), look up each '/'-delimited
+        # prefix of every ID, which is linear in the total length of the IDs.
+        node_ids = self.nodes_by_id.keys()
+        for node_id in node_ids:
+            slash = node_id.find("/")
+            while slash != -1:
+                prefix = node_id[:slash]
+                if prefix in node_ids:
+                    raise ValueError(
+                        f"Node ID collision detected: '{prefix}' is a prefix of '{node_id}'. "
+                        f"This would cause conflicts when composite nodes are expanded. "
+                        f"Please ensure no node ID is a prefix of another when followed by '/'."
+                    )
+                slash = node_id.find("/", slash + 1)
         return self
 
     def get_ready_nodes(
@@ -160,7 +337,7 @@ class Workflow(ImmutableBaseModel):
         input: DataMapping,
         node_outputs: Mapping[str, DataMapping] | None = None,
         partial_results: Mapping[str, DataMapping] | None = None,
-    ) -> Mapping[str, DataMapping]:
+    ) -> dict[str, DataMapping]:
         """
         Given the input and the set of nodes which have already finished, return
         the nodes that are now ready to be executed and their arguments.
@@ -169,6 +346,7 @@ class Workflow(ImmutableBaseModel):
 
         For efficiency, this method can use partial results to avoid
         recalculating already finished nodes.
+        The result is always a new dict, which the caller is free to modify.
         """
         if node_outputs is None:
             node_outputs = {}
@@ -176,41 +354,96 @@ class Workflow(ImmutableBaseModel):
         ready_nodes: dict[str, DataMapping] = (
             {} if partial_results is None else dict(partial_results)
         )
-        for node in self.nodes:
+        # edge_plan has an entry for every node, in the same order as nodes
+        for node_id, plan in self.edge_plan.items():
             # remove the node if it is now finished
-            if node.id in node_outputs:
-                if node.id in ready_nodes:
-                    ready_nodes.pop(node.id)
+            if node_id in node_outputs:
+                ready_nodes.pop(node_id, None)
                 continue
             # skip the node if it is already in the ready set
-            if node.id in ready_nodes:
+            if node_id in ready_nodes:
                 continue
 
             # node might be ready, we have to check all its input edges
-            ready: bool = True
-            node_input_dict: DataMapping = {}
-            for target_key, edge in self.edges_by_target[node.id].items():
-                # if the input is missing, we will let the node figure it out
-                if isinstance(edge, InputEdge):
-                    node_input_dict[target_key] = input[edge.input_key]
-                elif edge.source_id in node_outputs:
-                    node_input_dict[target_key] = node_outputs[edge.source_id][
-                        edge.source_key
-                    ]
-                else:
-                    ready = False
-                    break
-            if not ready:
+            node_input_dict = self._get_node_input(plan, input, node_outputs)
+            if node_input_dict is None:
                 continue
+            ready_nodes[node_id] = node_input_dict
+        return ready_nodes
 
-            try:
-                ready_nodes[node.id] = node_input_dict
-            except ValidationError as e:
-                raise UserException(
-                    f"Input {node_input_dict} for node {node.id} is invalid: {e}",
+    def get_ready_nodes_incremental(
+        self,
+        just_finished_id: str,
+        *,
+        input: DataMapping,
+        node_outputs: Mapping[str, DataMapping],
+        remaining: dict[str, int],
+    ) -> dict[str, DataMapping]:
+        """
+        An incremental alternative to get_ready_nodes, which only looks at the
+        nodes that depend on the node that just finished, instead of the entire
+        workflow.
+
+        remaining maps each node ID to the number of its in-edges whose source
+        node has not finished yet. The caller should start from a copy of
+        in_degrees (or from get_remaining_in_degrees, when resuming with some
+        node outputs), using get_ready_nodes to find the initially ready nodes,
+        then pass the same dict each time a node finishes; it is updated in
+        place.
+
+        Returns only the nodes that became ready because just_finished_id
+        finished, and their arguments.
+        """
+        ready_nodes: dict[str, DataMapping] = {}
+        edge_plan = self.edge_plan
+        for target_id, _, _ in self.dependents[just_finished_id]:
+            count = remaining[target_id] - 1
+            remaining[target_id] = count
+            if count == 0:
+                node_input_dict = self._get_node_input(
+                    edge_plan[target_id], input, node_outputs
                 )
+                assert node_input_dict is not None
+                ready_nodes[target_id] = node_input_dict
         return ready_nodes
 
+    def get_remaining_in_degrees(
+        self,
+        node_outputs: Mapping[str, DataMapping],
+    ) -> dict[str, int]:
+        """
+        For each node, the number of its in-edges whose source node has not
+        finished yet, given the outputs of the nodes that have.
+        """
+        return {
+            node_id: sum(
+                not is_input and source not in node_outputs
+                for _, is_input, source, _ in entries
+            )
+            for node_id, entries in self.edge_plan.items()
+        }
+
+    @staticmethod
+    def _get_node_input(
+        plan: Sequence[tuple[str, bool, str, str | None]],
+        input: DataMapping,
+        node_outputs: Mapping[str, DataMapping],
+    ) -> dict[str, Value] | None:
+        """
+        Collects a node's arguments from its edge plan, or returns None if any
+        of its source nodes has not finished yet.
+        """
+        node_input_dict: dict[str, Value] = {}
+        for target_key, is_input, source, source_key in plan:
+            # if the input is missing, we will let the node figure it out
+            if is_input:
+                node_input_dict[target_key] = input[source]
+            elif source in node_outputs:
+                node_input_dict[target_key] = node_outputs[source][source_key]  # type: ignore
+            else:
+                return None
+        return node_input_dict
+
     def get_output(
         self,
         node_outputs: Mapping[str, DataMapping],
@@ -224,22 +457,21 @@ class Workflow(ImmutableBaseModel):
         output field is available.
         """
         output: DataMapping = {}
-        for edge in self.output_edges:
-            if edge.source_id not in node_outputs:
+        for source_id, source_key, output_key in self.output_plan:
+            if source_id not in node_outputs:
                 if partial:
                     continue
                 raise UserException(
-                    f"Cannot get output from node {edge.source_id}.",
+                    f"Cannot get output from node {source_id}.",
                 )
-            node_output = node_outputs[edge.source_id]
-            if edge.source_key not in node_output:
+            node_output = node_outputs[source_id]
+            if source_key not in node_output:
                 if partial:
                     continue
                 raise UserException(
-                    f"Cannot get output from node {edge.source_id} at key '{edge.source_key}'.",
+                    f"Cannot get output from node {source_id} at key '{source_key}'.",
                 )
-            output_field = node_output[edge.source_key]
-            output[edge.output_key] = output_field
+            output[output_key] = node_output[source_key]
         return output
 
     def expand_node(
@@ -277,6 +509,9 @@ class Workflow(ImmutableBaseModel):
                 node for node in self.nodes if node.id != node_id
             ] + list(subgraph.nodes)
             new_edges: list[Edge] = list(subgraph.edges)
+            # only the edges that are reconnected to the subgraph need their
+            # types checked again
+            type_checked_edges: set[Edge] = set(subgraph.edges)
             new_input_edges: list[InputEdge] = []
             new_output_edges: list[OutputEdge] = []
 
@@ -334,6 +569,7 @@ class Workflow(ImmutableBaseModel):
                         )
                 else:
                     new_edges.append(edge)
+                    type_checked_edges.add(edge)
 
             # Handle output edges
             for output_edge in self.output_edges:
@@ -358,11 +594,14 @@ class Workflow(ImmutableBaseModel):
                 else:
                     new_output_edges.append(output_edge)
 
-            return Workflow(
-                nodes=new_nodes,
-                edges=new_edges,
-                input_edges=new_input_edges,
-                output_edges=new_output_edges,
+            return Workflow.model_validate(
+                {
+                    "nodes": new_nodes,
+                    "edges": new_edges,
+                    "input_edges": new_input_edges,
+                    "output_edges": new_output_edges,
+                },
+                context={_TYPE_CHECKED_EDGES: type_checked_edges},
             )
         except Exception as e:
             raise NodeExpansionException(node_id, workflow=subgraph) from e
@@ -377,41 +616,54 @@ class Workflow(ImmutableBaseModel):
         Returns:
             A new Workflow with all node IDs prefixed with '{namespace}/'
         """
+        # concatenating a precomputed prefix is cheaper than an f-string per ID
+        prefix = namespace + "/"
+
         # Create namespaced nodes
         namespaced_nodes = [node.with_namespace(namespace) for node in self.nodes]
 
         # Create namespaced edges (update source_id and target_id)
+        # Building new edges directly is cheaper than model_copy(update=...),
+        # and unlike model_construct, still validates them.
         namespaced_edges = [
-            edge.model_copy(
-                update={
-                    "source_id": f"{namespace}/{edge.source_id}",
-                    "target_id": f"{namespace}/{edge.target_id}",
-                }
+            Edge(
+                source_id=prefix + edge.source_id,
+                source_key=edge.source_key,
+                target_id=prefix + edge.target_id,
+                target_key=edge.target_key,
             )
             for edge in self.edges
         ]
 
         # Create namespaced input edges (update target_id only)
         namespaced_input_edges = [
-            input_edge.model_copy(
-                update={"target_id": f"{namespace}/{input_edge.target_id}"}
+            InputEdge(
+                input_key=input_edge.input_key,
+                target_id=prefix + input_edge.target_id,
+                target_key=input_edge.target_key,
             )
             for input_edge in self.input_edges
         ]
 
         # Create namespaced output edges (update source_id only)
         namespaced_output_edges = [
-            output_edge.model_copy(
-                update={"source_id": f"{namespace}/{output_edge.source_id}"}
+            OutputEdge(
+                source_id=prefix + output_edge.source_id,
+                source_key=output_edge.source_key,
+                output_key=output_edge.output_key,
             )
             for output_edge in self.output_edges
         ]
 
-        return Workflow(
-            nodes=namespaced_nodes,
-            edges=namespaced_edges,
-            input_edges=namespaced_input_edges,
-            output_edges=namespaced_output_edges,
+        # namespacing changes neither the keys nor the node types of the edges
+        return Workflow.model_validate(
+            {
+                "nodes": namespaced_nodes,
+                "edges": namespaced_edges,
+                "input_edges": namespaced_input_edges,
+                "output_edges": namespaced_output_edges,
+            },
+            context={_TYPE_CHECKED_EDGES: set(namespaced_edges)},
         )
 
 
@@ -1,7 +1,9 @@
 # workflow_engine/execution/__init__.py
+from .parallel import ParallelExecutionAlgorithm
 from .topological import TopologicalExecutionAlgorithm
 
 
 __all__ = [
+    "ParallelExecutionAlgorithm",
     "TopologicalExecutionAlgorithm",
 ]
@@ -0,0 +1,109 @@
+# workflow_engine/execution/parallel.py
+import asyncio
+
+from overrides import override
+
+from ..core import Context, DataMapping, ExecutionAlgorithm, Workflow, WorkflowErrors
+
+
+class ParallelExecutionAlgorithm(ExecutionAlgorithm):
+    """
+    Executes the workflow on the current thread in topological order, running
+    all of the nodes that are ready at the same time concurrently.
+
+    This only helps for nodes that spend their time waiting (e.g. on I/O), since
+    all of the nodes share the same event loop.
+    If any node in a batch fails, the rest of the batch still finishes, all of
+    the errors are reported, and no further nodes are started.
+    """
+
+    @override
+    async def execute(
+        self,
+        *,
+        context: Context,
+        workflow: Workflow,
+        input: DataMapping,
+    ) -> tuple[WorkflowErrors, DataMapping]:
+        result = await context.on_workflow_start(workflow=workflow, input=input)
+        if result is not None:
+            return result
+
+        node_outputs: dict[str, DataMapping] = {}
+        errors = WorkflowErrors()
+        # only set once every node has finished without errors
+        output: DataMapping | None = None
+
+        try:
+            ready_nodes = workflow.get_ready_nodes(input=input)
+            remaining = dict(workflow.in_degrees)
+            while len(ready_nodes) > 0:
+                batch = ready_nodes
+                ready_nodes = {}
+                node_results = await asyncio.gather(
+                    *(
+                        workflow.nodes_by_id[node_id](context, node_input)
+                        for node_id, node_input in batch.items()
+                    ),
+                    return_exceptions=True,
+                )
+
+                expanded = False
+                for node_id, node_result in zip(batch, node_results):
+                    if isinstance(node_result, Exception):
+                        errors.add(node_result)
+                    elif isinstance(node_result, BaseException):
+                        # e.g. cancellation, which is not ours to report
+                        raise node_result
+                    elif isinstance(node_result, Workflow):
+                        workflow = workflow.expand_node(node_id, node_result)
+                        expanded = True
+                    else:
+                        node_outputs[node_id] = node_result
+                        if not expanded:
+                            ready_nodes.update(
+                                workflow.get_ready_nodes_incremental(
+                                    node_id,
+                                    input=input,
+                                    node_outputs=node_outputs,
+                                    remaining=remaining,
+                                )
+                            )
+                if errors.any():
+                    break
+
+                if expanded:
+                    # the graph has changed, so start over from a full scan
+                    ready_nodes = workflow.get_ready_nodes(
+                        input=input,
+                        node_outputs=node_outputs,
+                    )
+                    remaining = workflow.get_remaining_in_degrees(node_outputs)
+
+            if not errors.any():
+                output = workflow.get_output(node_outputs)
+        except Exception as e:
+            errors.add(e)
+
+        if output is None:
+            partial_output = workflow.get_output(node_outputs, partial=True)
+            errors, partial_output = await context.on_workflow_error(
+                workflow=workflow,
+                input=input,
+                errors=errors,
+                partial_output=partial_output,
+            )
+            return errors, partial_output
+
+        output = await context.on_workflow_finish(
+            workflow=workflow,
+            input=input,
+            output=output,
+        )
+
+        return errors, output
+
+
+__all__ = [
+    "ParallelExecutionAlgorithm",
+]
@@ -1,7 +1,5 @@
 # workflow_engine/execution/topological.py
 
-from collections.abc import Mapping
-
 from overrides import override
 
 from ..core import Context, DataMapping, ExecutionAlgorithm, Workflow, WorkflowErrors
@@ -26,11 +24,14 @@ class TopologicalExecutionAlgorithm(ExecutionAlgorithm):
             # TODO: maybe retry workflows that have failed
             return result
 
-        node_outputs: Mapping[str, DataMapping] = {}
+        node_outputs: dict[str, DataMapping] = {}
         errors = WorkflowErrors()
 
         try:
-            ready_nodes = dict(workflow.get_ready_nodes(input=input))
+            ready_nodes = workflow.get_ready_nodes(input=input)
+            # the number of unfinished source nodes of each node, so that only
+            # the dependents of a finished node need to be checked
+            remaining = dict(workflow.in_degrees)
             while len(ready_nodes) > 0:
                 node_id, node_input = ready_nodes.popitem()
                 node = workflow.nodes_by_id[node_id]
@@ -38,17 +39,24 @@ class TopologicalExecutionAlgorithm(ExecutionAlgorithm):
                 node_result = await node(context, node_input)
                 if isinstance(node_result, Workflow):
                     workflow = workflow.expand_node(node_id, node_result)
-
-                else:
-                    node_outputs[node.id] = node_result
-
-                ready_nodes = dict(
-                    workflow.get_ready_nodes(
+                    # the graph has changed, so start over from a full scan
+                    ready_nodes = workflow.get_ready_nodes(
                         input=input,
                         node_outputs=node_outputs,
                         partial_results=ready_nodes,
                     )
-                )
+                    remaining = workflow.get_remaining_in_degrees(node_outputs)
+
+                else:
+                    node_outputs[node.id] = node_result
+                    ready_nodes.update(
+                        workflow.get_ready_nodes_incremental(
+                            node_id,
+                            input=input,
+                            node_outputs=node_outputs,
+                            remaining=remaining,
+                        )
+                    )
 
             output = workflow.get_output(node_outputs)
         except Exception as e:
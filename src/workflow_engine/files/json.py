@@ -1,7 +1,7 @@
 # workflow_engine/files/json.py
 import datetime
 import json
-from collections.abc import Sequence
+from collections.abc import Callable, Mapping, Sequence
 from logging import getLogger
 from typing import Any, ClassVar, Self, Type
 
@@ -23,11 +23,44 @@ from ..core import (
 from ..core.values import get_origin_and_args
 from .text import TextFileValue
 
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:  # optional, only used to speed up parsing
+    orjson = None
+
 logger = getLogger(__name__)
 
 
+def _parse_json(raw: bytes) -> Any:
+    """
+    Parses a JSON document from raw UTF-8 bytes, using orjson if it is
+    installed.
+
+    orjson is stricter than the json module (e.g. it rejects NaN), so anything
+    it refuses is handed to the json module, to parse exactly the same
+    documents either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode("utf-8"))
+
+
+_custom_json_serializers: Mapping[type, Callable[[Any], Any]] = {
+    datetime.datetime: datetime.datetime.isoformat,
+    datetime.date: datetime.date.isoformat,
+}
+
+
 # HACK: serialize datetime objects
 def _custom_json_serializer(obj: object) -> Any:
+    # look up the exact type first, and only then fall back to isinstance for
+    # subclasses
+    serializer = _custom_json_serializers.get(type(obj))
+    if serializer is not None:
+        return serializer(obj)
     if isinstance(obj, (datetime.datetime, datetime.date)):
         return obj.isoformat()
     return None
@@ -41,59 +74,43 @@ class JSONFileValue(TextFileValue):
     mime_type: ClassVar[str] = "application/json"
 
     async def read_data(self, context: "Context") -> Any:
-        return json.loads(await self.read_text(context))
+        return _parse_json(await self.read(context))
 
     async def write_data(self, context: "Context", data: Any) -> Self:
         text = json.dumps(data, default=_custom_json_serializer)
         return await self.write_text(context, text)
 
 
-@JSONFileValue.register_cast_to(NullValue)
-async def cast_json_file_to_null(value: JSONFileValue, context: "Context") -> NullValue:
-    data = await value.read_data(context)
-    if data is None:
-        return NullValue(None)
-    raise ValueError(f"Expected null, got {type(data)}")
+# For each primitive value type, the type of parsed JSON data it can be cast
+# from, and that type's name for error messages.
+# NOTE: like isinstance, this accepts booleans as integers.
+_json_primitive_types: Mapping[Type[Value], tuple[type, str]] = {
+    NullValue: (type(None), "null"),
+    BooleanValue: (bool, "bool"),
+    IntegerValue: (int, "int"),
+    FloatValue: (float, "float"),
+    StringValue: (str, "str"),
+}
+
+
+def _json_file_to_primitive_caster(
+    target_type: Type[Value],
+    data_type: type,
+    data_type_name: str,
+) -> Caster[JSONFileValue, Value]:
+    async def _cast(value: JSONFileValue, context: "Context") -> Value:
+        data = await value.read_data(context)
+        if isinstance(data, data_type):
+            return target_type(data)
+        raise ValueError(f"Expected {data_type_name}, got {type(data)}")
 
-
-@JSONFileValue.register_cast_to(BooleanValue)
-async def cast_json_file_to_boolean(
-    value: JSONFileValue, context: "Context"
-) -> BooleanValue:
-    data = await value.read_data(context)
-    if isinstance(data, bool):
-        return BooleanValue(data)
-    raise ValueError(f"Expected bool, got {type(data)}")
-
-
-@JSONFileValue.register_cast_to(IntegerValue)
-async def cast_json_file_to_integer(
-    value: JSONFileValue, context: "Context"
-) -> IntegerValue:
-    data = await value.read_data(context)
-    if isinstance(data, int):
-        return IntegerValue(data)
-    raise ValueError(f"Expected int, got {type(data)}")
-
-
-@JSONFileValue.register_cast_to(FloatValue)
-async def cast_json_file_to_float(
-    value: JSONFileValue, context: "Context"
-) -> FloatValue:
-    data = await value.read_data(context)
-    if isinstance(data, float):
-        return FloatValue(data)
-    raise ValueError(f"Expected float, got {type(data)}")
+    return _cast
 
 
-@JSONFileValue.register_cast_to(StringValue)
-async def cast_json_file_to_string(
-    value: JSONFileValue, context: "Context"
-) -> StringValue:
-    data = await value.read_data(context)
-    if isinstance(data, str):
-        return StringValue(data)
-    raise ValueError(f"Expected str, got {type(data)}")
+for _target_type, (_data_type, _data_type_name) in _json_primitive_types.items():
+    JSONFileValue.register_cast_to(_target_type)(
+        _json_file_to_primitive_caster(_target_type, _data_type, _data_type_name)
+    )
 
 
 @JSONFileValue.register_generic_cast_to(SequenceValue)
@@ -149,9 +166,9 @@ class JSONLinesFileValue(TextFileValue):
     mime_type: ClassVar[str] = "application/jsonl"
 
     async def read_data(self, context: "Context") -> Sequence[Any]:
-        return [
-            json.loads(line) for line in (await self.read_text(context)).splitlines()
-        ]
+        # Split the raw bytes rather than decoded text: str.splitlines would
+        # also split on characters such as U+2028 that JSON strings may contain.
+        return [_parse_json(line) for line in (await self.read(context)).splitlines()]
 
     async def write_data(self, context: "Context", data: Sequence[Any]) -> Self:
         text = "\n".join(
@@ -185,12 +202,9 @@ def cast_json_lines_to_sequence(
         async def _read_lines(
             value: JSONLinesFileValue, context: "Context"
         ) -> SequenceValue[Any]:
-            return target_type(
-                [
-                    target_item_type.model_validate(item)
-                    for item in await value.read_data(context)
-                ]
-            )
+            # validating the whole list at once lets pydantic validate the items
+            # in a single call, instead of one model_validate call per item
+            return target_type(await value.read_data(context))
 
         return _read_lines
 
@@ -3,6 +3,8 @@
 Simple nodes for testing the workflow engine, with limited usefulness otherwise.
 """
 
+from functools import lru_cache
+from math import isqrt
 from typing import ClassVar, Literal
 
 from ..core import (
@@ -76,7 +78,9 @@ class SumNode(Node[SumNodeInput, SumNodeOutput, Empty]):
         return SumNodeOutput
 
     async def run(self, context: Context, input: SumNodeInput) -> SumNodeOutput:
-        return SumNodeOutput(sum=FloatValue(sum(v.root for v in input.values)))
+        # iterate the underlying list rather than the sequence's generator-based
+        # __iter__, and let sum consume a list rather than another generator
+        return SumNodeOutput(sum=FloatValue(sum([v.root for v in input.values.root])))
 
 
 class IntegerData(Data):
@@ -87,6 +91,22 @@ class FactorizationData(Data):
     factors: SequenceValue[IntegerValue]
 
 
+@lru_cache(maxsize=1024)
+def _factorize(value: int) -> tuple[int, ...]:
+    """
+    The positive factors of a positive integer in increasing order, found by
+    trial division up to its square root.
+    """
+    small: list[int] = []
+    large: list[int] = []
+    for i in range(1, isqrt(value) + 1):
+        if value % i == 0:
+            small.append(i)
+            if i * i != value:
+                large.append(value // i)
+    return tuple(small + large[::-1])
+
+
 class FactorizationNode(Node[IntegerData, FactorizationData, Empty]):
     TYPE_INFO: ClassVar[NodeTypeInfo] = NodeTypeInfo.from_parameter_type(
         name="Factorization",
@@ -109,10 +129,10 @@ class FactorizationNode(Node[IntegerData, FactorizationData, Empty]):
     async def run(self, context: Context, input: IntegerData) -> FactorizationData:
         value = input.value.root
         if value > 0:
-            return FactorizationData(
-                factors=SequenceValue(
-                    [IntegerValue(i) for i in range(1, value + 1) if value % i == 0]
-                )
+            # let the field validator wrap the plain ints in one call, rather
+            # than building each IntegerValue in Python and revalidating it
+            return FactorizationData.model_validate(
+                {"factors": list(_factorize(value))}
             )
         raise ValueError("Can only factorize positive integers")
 
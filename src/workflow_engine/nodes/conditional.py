@@ -3,6 +3,7 @@
 Conditional nodes that run different workflows depending on a condition input.
 """
 
+from functools import cached_property
 from typing import ClassVar, Literal, Self, Type
 
 from overrides import override
@@ -60,9 +61,10 @@ class IfNode(Node[ConditionalInput, Empty, IfParams]):
 
     type: Literal["If"] = "If"  # pyright: ignore[reportIncompatibleVariableOverride]
 
-    @property
+    # params are immutable, so the generated types only need to be built once
+    @cached_property
     @override
-    def input_type(self) -> Type[ConditionalInput]:
+    def input_type(self) -> Type[ConditionalInput]:  # pyright: ignore[reportIncompatibleMethodOverride]
         fields = dict(get_data_fields(ConditionalInput))
         for key, field in self.params.if_true.root.input_fields.items():
             assert key not in fields
@@ -109,18 +111,18 @@ class IfElseNode(Node[ConditionalInput, Data, IfElseParams]):
     )
     type: Literal["IfElse"] = "IfElse"  # pyright: ignore[reportIncompatibleVariableOverride]
 
-    @property
+    @cached_property
     @override
-    def input_type(self) -> Type[ConditionalInput]:
+    def input_type(self) -> Type[ConditionalInput]:  # pyright: ignore[reportIncompatibleMethodOverride]
         fields = dict(get_data_fields(ConditionalInput))
         for key, field in self.params.if_true.root.input_fields.items():
             assert key not in fields
             fields[key] = field
         return build_data_type("IfElseInput", fields, base_cls=ConditionalInput)
 
-    @property
+    @cached_property
     @override
-    def output_type(self) -> Type[Data]:
+    def output_type(self) -> Type[Data]:  # pyright: ignore[reportIncompatibleMethodOverride]
         fields = mapping_intersection(
             self.params.if_true.root.output_fields,
             self.params.if_false.root.output_fields,
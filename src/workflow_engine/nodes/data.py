@@ -5,6 +5,7 @@ Utility nodes to construct and deconstruct data objects.
 """
 
 from collections.abc import Sequence
+from functools import cached_property
 from typing import ClassVar, Generic, Literal, Self, Type, TypeVar
 
 from overrides import override
@@ -77,9 +78,9 @@ class GatherSequenceNode(Node[Data, SequenceData, SequenceParams]):
         N = self.params.length.root
         return [self.key(i) for i in range(N)]
 
-    @property
+    @cached_property
     @override
-    def input_type(self) -> Type[Data]:
+    def input_type(self) -> Type[Data]:  # pyright: ignore[reportIncompatibleMethodOverride]
         return build_data_type(
             "GatherSequenceInput",
             {key: (self.element_type, True) for key in self.keys},
@@ -93,8 +94,11 @@ class GatherSequenceNode(Node[Data, SequenceData, SequenceParams]):
     @override
     async def run(self, context: Context, input: Data) -> SequenceData:
         input_dict = input.to_dict()
-        return self.output_type(
-            sequence=SequenceValue[self.element_type](
+        # The elements were already validated against element_type by
+        # input_type, and revalidating every one of them again would dominate
+        # the cost of this node, so assemble the output without validation.
+        return self.output_type.model_construct(
+            sequence=SequenceValue[self.element_type].model_construct(
                 root=[input_dict[key] for key in self.keys]
             )
         )
@@ -147,9 +151,9 @@ class ExpandSequenceNode(Node[SequenceData, Data, SequenceParams]):
     def input_type(self) -> Type[SequenceData]:
         return SequenceData[self.element_type]
 
-    @property
+    @cached_property
     @override
-    def output_type(self) -> Type[Data]:
+    def output_type(self) -> Type[Data]:  # pyright: ignore[reportIncompatibleMethodOverride]
         return build_data_type(
             "ExpandSequenceOutput",
             {key: (self.element_type, True) for key in self.keys},
@@ -165,7 +169,10 @@ class ExpandSequenceNode(Node[SequenceData, Data, SequenceParams]):
         assert len(input.sequence) == N, (
             f"Expected sequence of length {N}, but got {len(input.sequence)}"
         )
-        return self.output_type(**{self.key(i): input.sequence[i] for i in range(N)})
+        # the elements were already validated by input_type
+        return self.output_type.model_construct(
+            **{self.key(i): input.sequence[i] for i in range(N)}
+        )
 
     @classmethod
     def from_length(
@@ -219,9 +226,9 @@ class GatherMappingNode(Node[Data, MappingData, MappingParams]):
     # TODO: make this serializable/deserializable
     value_type: ValueType = Value
 
-    @property
+    @cached_property
     @override
-    def input_type(self) -> Type[Data]:
+    def input_type(self) -> Type[Data]:  # pyright: ignore[reportIncompatibleMethodOverride]
         return build_data_type(
             "GatherMappingInput",
             {key.root: (self.value_type, True) for key in self.params.keys},
@@ -234,9 +241,13 @@ class GatherMappingNode(Node[Data, MappingData, MappingParams]):
 
     @override
     async def run(self, context: Context, input: Data) -> MappingData:
-        return self.output_type(
-            mapping=StringMapValue[self.value_type](
-                {key.root: getattr(input, key.root) for key in self.params.keys}
+        # the input fields are plain instance attributes, so read them from
+        # __dict__ instead of going through getattr for every key
+        fields = input.__dict__
+        # the values were already validated by input_type
+        return self.output_type.model_construct(
+            mapping=StringMapValue[self.value_type].model_construct(
+                root={key.root: fields[key.root] for key in self.params.keys.root}
             )
         )
 
@@ -285,9 +296,9 @@ class ExpandMappingNode(Node[MappingData, Data, MappingParams]):
     def input_type(self) -> Type[MappingData]:
         return MappingData[self.value_type]
 
-    @property
+    @cached_property
     @override
-    def output_type(self) -> Type[Data]:
+    def output_type(self) -> Type[Data]:  # pyright: ignore[reportIncompatibleMethodOverride]
         return build_data_type(
             "ExpandMappingOutput",
             {key.root: (self.value_type, True) for key in self.params.keys},
@@ -295,7 +306,8 @@ class ExpandMappingNode(Node[MappingData, Data, MappingParams]):
 
     @override
     async def run(self, context: Context, input: MappingData) -> Data:
-        return self.output_type(
+        # the values were already validated by input_type
+        return self.output_type.model_construct(
             **{key.root: input.mapping[key] for key in self.params.keys}
         )
 
@@ -3,6 +3,7 @@
 Nodes that iterate over a sequence of items.
 """
 
+from functools import cached_property
 from typing import ClassVar, Literal, Self, Type
 
 from overrides import override
@@ -71,47 +72,73 @@ class ForEachNode(Node[SequenceData, SequenceData, ForEachParams]):
     def output_type(self) -> Type[SequenceData]:
         return SequenceData[DataValue[self.workflow.output_type]]
 
+    @cached_property
+    def _expansions(self) -> dict[int, Workflow]:
+        return {}
+
     @override
     async def run(self, context: Context, input: SequenceData) -> Workflow:
         N = len(input.sequence)
 
+        # The expansion only depends on the length of the sequence and is
+        # immutable, so consecutive runs over sequences of the same length can
+        # share it. Only the latest one is kept, since each has O(N) nodes.
+        expansions = self._expansions
+        workflow = expansions.get(N)
+        if workflow is None:
+            expansions.clear()
+            workflow = expansions[N] = self._expand(N)
+        return workflow
+
+    def _expand(self, N: int) -> Workflow:
+        workflow = self.workflow
+        input_type = workflow.input_type
+        output_type = workflow.output_type
+
         nodes: list[Node] = []
         edges: list[Edge] = []
 
         expand = ExpandSequenceNode.from_length(
             id="expand",
             length=N,
-            element_type=DataValue[self.workflow.input_type],
+            element_type=DataValue[input_type],
         )
         gather = GatherSequenceNode.from_length(
             id="gather",
             length=N,
-            element_type=DataValue[self.workflow.output_type],
+            element_type=DataValue[output_type],
         )
         nodes.append(expand)
         nodes.append(gather)
 
+        # every item gets a namespaced copy of the same two adapters
+        input_adapter_template = ExpandDataNode.from_data_type(
+            id="input_adapter",
+            data_type=input_type,
+        )
+        output_adapter_template = GatherDataNode.from_data_type(
+            id="output_adapter",
+            data_type=output_type,
+        )
+
         for i in range(N):
             namespace = f"element_{i}"
-            input_adapter = ExpandDataNode.from_data_type(
-                id="input_adapter",
-                data_type=self.workflow.input_type,
-            ).with_namespace(namespace)
-            item_workflow = self.workflow.with_namespace(namespace)
-            output_adapter = GatherDataNode.from_data_type(
-                id="output_adapter",
-                data_type=self.workflow.output_type,
-            ).with_namespace(namespace)
+            input_adapter = input_adapter_template.with_namespace(namespace)
+            item_workflow = workflow.with_namespace(namespace)
+            output_adapter = output_adapter_template.with_namespace(namespace)
 
             nodes.append(input_adapter)
             nodes.extend(item_workflow.nodes)
             nodes.append(output_adapter)
 
+            # The Workflow built below type-checks every edge, so the adapter
+            # edges are built directly rather than through Edge.from_nodes,
+            # which would check them a second time.
             edges.append(
-                Edge.from_nodes(
-                    source=expand,
+                Edge(
+                    source_id=expand.id,
                     source_key=expand.key(i),
-                    target=input_adapter,
+                    target_id=input_adapter.id,
                     target_key="data",
                 )
             )
@@ -135,10 +162,10 @@ class ForEachNode(Node[SequenceData, SequenceData, ForEachParams]):
                     )
                 )
             edges.append(
-                Edge.from_nodes(
-                    source=output_adapter,
+                Edge(
+                    source_id=output_adapter.id,
                     source_key="data",
-                    target=gather,
+                    target_id=gather.id,
                     target_key=gather.key(i),
                 )
             )
@@ -1,9 +1,32 @@
+from collections.abc import Mapping
+
 import pytest
 
-from workflow_engine import Edge, InputEdge, IntegerValue, OutputEdge, Workflow
+from workflow_engine import (
+    Edge,
+    ExecutionAlgorithm,
+    InputEdge,
+    IntegerValue,
+    Node,
+    OutputEdge,
+    SequenceValue,
+    StringValue,
+    Workflow,
+)
 from workflow_engine.contexts import InMemoryContext
-from workflow_engine.execution import TopologicalExecutionAlgorithm
-from workflow_engine.nodes import AddNode, ConstantIntegerNode
+from workflow_engine.core.error import NodeExpansionException
+from workflow_engine.execution import (
+    ParallelExecutionAlgorithm,
+    TopologicalExecutionAlgorithm,
+)
+from workflow_engine.nodes import (
+    AddNode,
+    ConstantBooleanNode,
+    ConstantIntegerNode,
+    ErrorNode,
+    FactorizationNode,
+)
+from workflow_engine.nodes.error import ErrorParams
 
 
 @pytest.fixture
@@ -66,10 +89,13 @@ def test_workflow_serialization(workflow: Workflow):
 
 
 @pytest.mark.asyncio
-async def test_workflow_execution(workflow: Workflow):
+@pytest.mark.parametrize(
+    "algorithm",
+    [TopologicalExecutionAlgorithm(), ParallelExecutionAlgorithm()],
+)
+async def test_workflow_execution(workflow: Workflow, algorithm: ExecutionAlgorithm):
     """Test that the workflow executes correctly and produces the expected result."""
     context = InMemoryContext()
-    algorithm = TopologicalExecutionAlgorithm()
 
     c = -256
 
@@ -80,3 +106,191 @@ async def test_workflow_execution(workflow: Workflow):
     )
     assert not errors.any()
     assert output == {"sum": 42 + 2025 + c}
+
+
+@pytest.mark.unit
+def test_workflow_ready_nodes_incremental(workflow: Workflow):
+    """Test that incremental scheduling finds the same nodes as a full rescan."""
+    input = {"c": IntegerValue(-256)}
+    assert workflow.in_degrees == {"a": 0, "b": 0, "a+b": 2, "a+b+c": 1}
+
+    ready = workflow.get_ready_nodes(input=input)
+    assert set(ready) == {"a", "b"}
+
+    remaining = dict(workflow.in_degrees)
+    node_outputs = {"a": {"value": IntegerValue(42)}}
+    assert (
+        workflow.get_ready_nodes_incremental(
+            "a", input=input, node_outputs=node_outputs, remaining=remaining
+        )
+        == {}
+    )
+
+    node_outputs["b"] = {"value": IntegerValue(2025)}
+    ready = workflow.get_ready_nodes_incremental(
+        "b", input=input, node_outputs=node_outputs, remaining=remaining
+    )
+    assert ready == {"a+b": {"a": IntegerValue(42), "b": IntegerValue(2025)}}
+
+    node_outputs["a+b"] = {"sum": IntegerValue(2067)}
+    ready = workflow.get_ready_nodes_incremental(
+        "a+b", input=input, node_outputs=node_outputs, remaining=remaining
+    )
+    assert ready == {"a+b+c": {"a": IntegerValue(2067), "b": IntegerValue(-256)}}
+    assert workflow.get_remaining_in_degrees(node_outputs) == remaining
+
+
+@pytest.mark.unit
+def test_workflow_edge_indices(workflow: Workflow):
+    """Test that the edge indices agree with each other."""
+    assert workflow.dependents["a+b"] == (("a+b+c", "a", "sum"),)
+    assert workflow.dependents["a+b+c"] == ()
+    assert workflow.edge_plan["a+b+c"] == (
+        ("a", False, "a+b", "sum"),
+        ("b", True, "c", None),
+    )
+    assert workflow.edges_by_target["a+b+c"]["b"] is workflow.input_edges[0]
+
+    # the indices share the nodes' own ID strings, even when the edges do not
+    loaded = Workflow.model_validate_json(workflow.model_dump_json())
+    ((target_id, _, _),) = loaded.dependents["a+b"]
+    assert target_id is loaded.nodes[3].id
+    _, _, source_id, _ = loaded.edge_plan["a+b+c"][0]
+    assert source_id is loaded.nodes[2].id
+
+    # existing nodes and edges are kept as they are, rather than revalidated
+    rebuilt = Workflow(
+        nodes=list(workflow.nodes),
+        edges=list(workflow.edges),
+        input_edges=list(workflow.input_edges),
+        output_edges=list(workflow.output_edges),
+    )
+    assert rebuilt == workflow
+    assert isinstance(rebuilt.nodes, tuple)
+    assert all(a is b for a, b in zip(rebuilt.nodes, workflow.nodes))
+    assert all(a is b for a, b in zip(rebuilt.edges, workflow.edges))
+
+    with pytest.raises(ValueError, match="already in the graph"):
+        Workflow(
+            nodes=workflow.nodes,
+            edges=workflow.edges,
+            input_edges=[
+                *workflow.input_edges,
+                InputEdge(input_key="d", target_id="a+b+c", target_key="b"),
+            ],
+            output_edges=workflow.output_edges,
+        )
+
+
+@pytest.mark.unit
+def test_workflow_rejects_cycles():
+    """Test that a workflow whose edges form a cycle is rejected."""
+    x = AddNode(id="x")
+    y = AddNode(id="y")
+    with pytest.raises(ValueError, match="not a DAG"):
+        Workflow(
+            nodes=[x, y],
+            edges=[
+                Edge.from_nodes(source=x, source_key="sum", target=y, target_key="a"),
+                Edge.from_nodes(source=y, source_key="sum", target=x, target_key="a"),
+            ],
+            input_edges=[
+                InputEdge.from_node(input_key="a", target=x, target_key="b"),
+                InputEdge.from_node(input_key="b", target=y, target_key="b"),
+            ],
+            output_edges=[],
+        )
+
+
+@pytest.mark.unit
+def test_workflow_rejects_id_prefix_collisions():
+    """Test that no node ID may be a '/'-prefix of another, even if IDs in between sort between them."""
+    with pytest.raises(ValueError, match="'foo' is a prefix of 'foo/bar'"):
+        Workflow(
+            nodes=[
+                ConstantIntegerNode.from_value(id="foo", value=1),
+                ConstantIntegerNode.from_value(id="foo-x", value=2),
+                ConstantIntegerNode.from_value(id="foo/bar", value=3),
+            ],
+            edges=[],
+            input_edges=[],
+            output_edges=[],
+        )
+
+
+@pytest.mark.unit
+def test_expand_node_checks_reconnected_edges():
+    """Test that edges reconnected into a subgraph still have their types checked."""
+    flag = ConstantBooleanNode.from_value(id="flag", value=True)
+    node = ErrorNode(id="node", params=ErrorParams(error_name=StringValue("Oops")))
+    workflow = Workflow(
+        nodes=[flag, node],
+        edges=[
+            Edge.from_nodes(
+                source=flag, source_key="value", target=node, target_key="info"
+            )
+        ],
+        input_edges=[],
+        output_edges=[],
+    )
+
+    one = ConstantIntegerNode.from_value(id="one", value=1)
+    inner = AddNode(id="inner")
+    subgraph = Workflow(
+        nodes=[one, inner],
+        edges=[
+            Edge.from_nodes(
+                source=one, source_key="value", target=inner, target_key="b"
+            )
+        ],
+        input_edges=[
+            InputEdge.from_node(input_key="info", target=inner, target_key="a")
+        ],
+        output_edges=[],
+    )
+
+    # the subgraph is fine on its own, and can be namespaced
+    assert subgraph.with_namespace("node").nodes_by_id.keys() == {
+        "node/one",
+        "node/inner",
+    }
+
+    # but a boolean cannot be passed to the inner AddNode
+    with pytest.raises(NodeExpansionException) as exc_info:
+        workflow.expand_node("node", subgraph)
+    assert isinstance(exc_info.value.__cause__, TypeError)
+
+
+@pytest.mark.asyncio
+async def test_factorization_node():
+    """Test that FactorizationNode outputs a sequence of integers."""
+    context = InMemoryContext()
+    node = FactorizationNode(id="factors")
+    output = await node(context, {"value": IntegerValue(36)})
+    assert isinstance(output, Mapping)
+    assert output == {
+        "factors": SequenceValue[IntegerValue](
+            [IntegerValue(i) for i in (1, 2, 3, 4, 6, 9, 12, 18, 36)]
+        )
+    }
+    assert all(type(factor) is IntegerValue for factor in output["factors"])
+
+
+@pytest.mark.unit
+def test_workflow_dispatches_base_nodes():
+    """Test that plain Node objects are still dispatched to their subclass."""
+    node = ConstantIntegerNode.from_value(id="c", value=1)
+    # Node.__init__ cannot return the subclass instance, so this stays a Node
+    with pytest.warns(UserWarning, match="returning a value other than `self`"):
+        base_node = Node(**node.model_dump())
+    assert type(base_node) is Node
+
+    workflow = Workflow(
+        nodes=[base_node],
+        edges=[],
+        input_edges=[],
+        output_edges=[],
+    )
+    assert type(workflow.nodes[0]) is ConstantIntegerNode
+    assert workflow.nodes[0] == node
+    assert isinstance(workflow.nodes, tuple)
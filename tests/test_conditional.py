@@ -252,3 +252,20 @@ async def test_conditional_workflow_twice_series(
     )
     assert not errors.any(), errors
     assert output == {"result": start_value - 2}
+
+
+@pytest.mark.unit
+def test_conditional_types_built_once(
+    add_one_workflow: Workflow,
+    subtract_one_workflow: Workflow,
+):
+    """The generated input and output types are reused across accesses."""
+    node = IfElseNode.from_workflows(
+        id="if_else",
+        if_true=add_one_workflow,
+        if_false=subtract_one_workflow,
+    )
+    assert node.input_type is node.input_type
+    assert node.output_type is node.output_type
+    assert set(node.input_fields) == {"condition", "start"}
+    assert set(node.output_fields) == {"result"}
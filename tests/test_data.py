@@ -6,7 +6,9 @@ import pytest
 from pydantic import ValidationError
 
 from workflow_engine import BooleanValue, Data, IntegerValue, StringValue, ValueType
+from workflow_engine.contexts import InMemoryContext
 from workflow_engine.core.values import build_data_type, get_data_fields
+from workflow_engine.nodes import ExpandMappingNode, GatherMappingNode
 
 
 @pytest.fixture
@@ -84,3 +86,21 @@ def test_build_data_type(
         # extra field
         with pytest.raises(ValidationError):
             kls(name="John", age=30, active=True, extra=1)  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_gather_and_expand_mapping():
+    """Test that the mapping nodes round-trip their inputs."""
+    context = InMemoryContext()
+    gather = GatherMappingNode.from_keys("gather", ["a", "b"])
+    expand = ExpandMappingNode.from_keys("expand", ["a", "b"])
+
+    # the generated types are reused across accesses
+    assert gather.input_type is gather.input_type
+    assert expand.output_type is expand.output_type
+
+    input = {"a": IntegerValue(1), "b": StringValue("two")}
+    output = await gather(context, input)
+    assert isinstance(output, Mapping)
+    assert output["mapping"] == {"a": 1, "b": "two"}
+    assert (await expand(context, output)) == input
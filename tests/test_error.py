@@ -4,6 +4,7 @@ import pytest
 
 from workflow_engine import (
     Edge,
+    ExecutionAlgorithm,
     OutputEdge,
     StringValue,
     UserException,
@@ -11,7 +12,10 @@ from workflow_engine import (
     WorkflowErrors,
 )
 from workflow_engine.contexts import InMemoryContext
-from workflow_engine.execution import TopologicalExecutionAlgorithm
+from workflow_engine.execution import (
+    ParallelExecutionAlgorithm,
+    TopologicalExecutionAlgorithm,
+)
 from workflow_engine.nodes import ConstantStringNode, ErrorNode
 
 
@@ -54,7 +58,13 @@ def test_workflow_serialization(workflow: Workflow):
 
 
 @pytest.mark.asyncio
-async def test_workflow_error_handling(workflow: Workflow):
+@pytest.mark.parametrize(
+    "algorithm",
+    [TopologicalExecutionAlgorithm(), ParallelExecutionAlgorithm()],
+)
+async def test_workflow_error_handling(
+    workflow: Workflow, algorithm: ExecutionAlgorithm
+):
     """Test that the workflow properly handles errors and calls context callbacks."""
     context = InMemoryContext()
 
@@ -63,8 +73,6 @@ async def test_workflow_error_handling(workflow: Workflow):
     mock_on_node_error = AsyncMock(side_effect=original_on_node_error)
     context.on_node_error = mock_on_node_error
 
-    algorithm = TopologicalExecutionAlgorithm()
-
     errors, output = await algorithm.execute(
         context=context,
         workflow=workflow,
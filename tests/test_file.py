@@ -51,3 +51,31 @@ async def test_cast_jsonlines_to_sequence(context: Context):
     assert (await json_files[0].read_data(context)) == {"a": 1}
     assert (await json_files[1].read_data(context)) == {"b": 2}
     assert (await json_files[2].read_data(context)) == {"c": 3}
+
+
+@pytest.mark.unit
+async def test_read_json_edge_cases(context: Context):
+    """Test that JSON files are parsed the same way with or without orjson."""
+    json_file = JSONFileValue.from_path("infinity.json")
+    await json_file.write_data(context, {"x": float("inf")})
+    assert (await json_file.read_data(context)) == {"x": float("inf")}
+
+    # U+2028 may appear unescaped inside a JSON string, but is a line break to
+    # str.splitlines
+    jsonl_file = JSONLinesFileValue.from_path("separator.jsonl")
+    await jsonl_file.write(context, '"a\u2028b"\n"c"'.encode("utf-8"))
+    assert (await jsonl_file.read_data(context)) == ["a\u2028b", "c"]
+
+
+@pytest.mark.unit
+async def test_cast_json_file_to_primitive(context: Context):
+    """Test that only JSON files with a matching top-level value cast."""
+    json_file = JSONFileValue.from_path("number.json")
+    await json_file.write(context, b" 42\n")
+    assert (await IntegerValue.cast_from(json_file, context=context)) == 42
+
+    for contents in (b'\n {"value": 42}', b"[42]"):
+        json_file = JSONFileValue.from_path("container.json")
+        await json_file.write(context, contents)
+        with pytest.raises(ValueError, match="Expected int"):
+            await IntegerValue.cast_from(json_file, context=context)
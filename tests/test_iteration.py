@@ -1,8 +1,11 @@
 import pytest
 
-from workflow_engine import InputEdge, OutputEdge, Workflow
+from workflow_engine import ExecutionAlgorithm, InputEdge, OutputEdge, Workflow
 from workflow_engine.contexts import InMemoryContext
-from workflow_engine.execution import TopologicalExecutionAlgorithm
+from workflow_engine.execution import (
+    ParallelExecutionAlgorithm,
+    TopologicalExecutionAlgorithm,
+)
 from workflow_engine.nodes import AddNode, ForEachNode
 
 
@@ -66,10 +69,15 @@ def workflow(add_workflow: Workflow) -> Workflow:
 
 
 @pytest.mark.asyncio
-async def test_for_each_simple_sequence(workflow: Workflow):
+@pytest.mark.parametrize(
+    "algorithm",
+    [TopologicalExecutionAlgorithm(), ParallelExecutionAlgorithm()],
+)
+async def test_for_each_simple_sequence(
+    workflow: Workflow, algorithm: ExecutionAlgorithm
+):
     """Test that ForEachNode processes a simple sequence of addition operations."""
     context = InMemoryContext()
-    algorithm = TopologicalExecutionAlgorithm()
 
     input = workflow.input_type.model_validate(
         {
@@ -104,10 +112,13 @@ async def test_for_each_simple_sequence(workflow: Workflow):
 
 
 @pytest.mark.asyncio
-async def test_for_each_empty(workflow: Workflow):
+@pytest.mark.parametrize(
+    "algorithm",
+    [TopologicalExecutionAlgorithm(), ParallelExecutionAlgorithm()],
+)
+async def test_for_each_empty(workflow: Workflow, algorithm: ExecutionAlgorithm):
     """Test that ForEachNode processes an empty sequence."""
     context = InMemoryContext()
-    algorithm = TopologicalExecutionAlgorithm()
 
     input = workflow.input_type.model_validate(
         {
@@ -131,3 +142,22 @@ async def test_for_each_empty(workflow: Workflow):
             }
         ).to_dict()
     )
+
+
+@pytest.mark.asyncio
+async def test_for_each_reuses_expansion(add_workflow: Workflow):
+    """Test that ForEachNode reuses its expansion for sequences of one length."""
+    context = InMemoryContext()
+    for_each = ForEachNode.from_workflow(id="for_each", workflow=add_workflow)
+
+    def make_input(*items: tuple[float, float]):
+        return for_each.input_type.model_validate(
+            {"sequence": [{"a": a, "b": b} for a, b in items]}
+        )
+
+    expansion = await for_each.run(context, make_input((1.0, 2.0), (3.0, 4.0)))
+    assert await for_each.run(context, make_input((5.0, 6.0), (7.0, 8.0))) is expansion
+
+    other_expansion = await for_each.run(context, make_input((1.0, 2.0)))
+    assert other_expansion is not expansion
+    assert len(other_expansion.nodes) < len(expansion.nodes)
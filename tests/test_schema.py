@@ -12,6 +12,8 @@ In this file we follow the convention of using T for the expected type and U for
 the type returned by .to_value_cls().
 """
 
+import json
+
 import pytest
 
 from workflow_engine import (
@@ -32,6 +34,7 @@ from workflow_engine.core.values import validate_value_schema
 from workflow_engine.core.values.schema import (
     BooleanValueSchema,
     BaseValueSchema,
+    DataValueSchema,
     FloatValueSchema,
     IntegerValueSchema,
     NullValueSchema,
@@ -562,6 +565,68 @@ def test_data_schema_roundtrip():
     assert t2.bar == u2.root.bar
 
 
+class FooBarBazData(FooBarData):
+    baz: StringValue
+
+
+@pytest.mark.unit
+def test_data_schema_cached_per_class():
+    schema = FooBarData.to_value_schema()
+    assert FooBarData.to_value_schema() is schema
+
+    # subclasses compute their own schema instead of inheriting the parent's
+    sub_schema = FooBarBazData.to_value_schema()
+    assert sub_schema is not schema
+    assert isinstance(sub_schema, DataValueSchema)
+    assert "baz" in sub_schema.properties
+
+
+@pytest.mark.unit
+def test_data_schema_value_cls_cached():
+    schema = validate_value_schema(FooBarData.model_json_schema())
+    U = schema.to_value_cls()
+    # rebuilding the same schema reuses the class instead of creating a new one
+    assert schema.to_value_cls() is U
+
+
+@pytest.mark.unit
+def test_nested_schema_value_cls_cached():
+    schema = validate_value_schema(
+        {"type": "array", "items": {"type": "array", "items": {"type": "integer"}}}
+    )
+    assert isinstance(schema, SequenceValueSchema)
+    assert schema.to_value_cls() == SequenceValue[SequenceValue[IntegerValue]]
+    # nested schemas without references reuse their own cached classes
+    inner = schema.items
+    assert isinstance(inner, SequenceValueSchema)
+    assert "_value_cls" in inner.__dict__
+    assert "_value_cls" in inner.items.__dict__
+
+
+@pytest.mark.unit
+def test_data_schema_identical_schemas_share_cls():
+    json_schema = FooBarData.model_json_schema()
+    schema1 = validate_value_schema(json_schema)
+    schema2 = validate_value_schema(json.dumps(json_schema))
+    assert schema1 is not schema2
+    assert schema1.to_value_cls() is schema2.to_value_cls()
+
+    # a different field set gets its own class, even with the same title
+    other = dict(json_schema, properties={"foo": json_schema["properties"]["foo"]})
+    assert validate_value_schema(other).to_value_cls() is not schema1.to_value_cls()
+
+
+@pytest.mark.unit
+def test_data_schema_from_json_text():
+    schema = FooBarData.to_value_schema()
+    json_text = json.dumps(FooBarData.model_json_schema())
+    assert validate_value_schema(json_text) == schema
+    assert validate_value_schema(json_text.encode()) == schema
+
+    with pytest.raises(ValueError):
+        validate_value_schema('{"type": "not a type"')
+
+
 @pytest.mark.unit
 def test_data_schema_manual():
     T = FooBarData
@@ -772,3 +837,24 @@ def test_value_schema_value_aliasing():
     )
     t2 = T.model_validate(u2.model_dump())
     assert t2 == u2
+
+
+@pytest.mark.unit
+def test_value_schema_variant_selection():
+    cases = [
+        ({"type": "boolean"}, BooleanValueSchema),
+        ({"type": "integer"}, IntegerValueSchema),
+        ({"type": "number"}, FloatValueSchema),
+        ({"type": "null"}, NullValueSchema),
+        ({"type": "string"}, StringValueSchema),
+        ({"type": "array", "items": {"type": "string"}}, SequenceValueSchema),
+        ({"type": "object"}, StringMapValueSchema),
+        ({"type": "object", "title": "Foo", "properties": {}}, DataValueSchema),
+        ({"$ref": "#/$defs/Foo"}, ReferenceValueSchema),
+        ({"title": "StringValue"}, BaseValueSchema),
+    ]
+    for json_schema, schema_cls in cases:
+        assert type(validate_value_schema(json_schema)) is schema_cls
+
+    with pytest.raises(ValueError):
+        validate_value_schema({"type": "not a type"})
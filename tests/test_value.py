@@ -15,6 +15,7 @@ from workflow_engine.core import (
 from workflow_engine.core.values.value import (
     get_origin_and_args,
     get_value_type_key,
+    parametrize,
 )
 
 
@@ -123,6 +124,9 @@ async def test_sequence_value(context):
     )
     assert len(int_sequence) == 3
     assert all(isinstance(x, IntegerValue) for x in int_sequence)
+    assert 2 in int_sequence
+    assert IntegerValue(3) in int_sequence
+    assert 4 not in int_sequence
 
     # Cast to sequence of strings
     str_sequence = await int_sequence.cast_to(
@@ -140,6 +144,45 @@ async def test_sequence_value(context):
     assert int_sequence_again == int_sequence
 
 
+@pytest.mark.unit
+async def test_sequence_bulk_cast(context):
+    """Test casting sequences between integers and floats, which is done in bulk."""
+    int_sequence = SequenceValue[IntegerValue](
+        [IntegerValue(1), IntegerValue(2), IntegerValue(3)]
+    )
+    float_sequence = await int_sequence.cast_to(
+        SequenceValue[FloatValue], context=context
+    )
+    assert isinstance(float_sequence, SequenceValue)
+    assert all(type(x) is FloatValue for x in float_sequence)
+    assert [x.root for x in float_sequence] == [1.0, 2.0, 3.0]
+
+    int_sequence_again = await float_sequence.cast_to(
+        SequenceValue[IntegerValue], context=context
+    )
+    assert all(type(x) is IntegerValue for x in int_sequence_again)
+    assert int_sequence_again == int_sequence
+
+    with pytest.raises(ValueError, match="Cannot convert"):
+        await SequenceValue[FloatValue]([FloatValue(1.0), FloatValue(2.5)]).cast_to(
+            SequenceValue[IntegerValue], context=context
+        )
+
+
+@pytest.mark.unit
+async def test_empty_container_cast(context):
+    """Test that empty containers can be cast."""
+    empty_sequence = await SequenceValue[IntegerValue]([]).cast_to(
+        SequenceValue[StringValue], context=context
+    )
+    assert empty_sequence == []
+
+    empty_map = await StringMapValue[IntegerValue]({}).cast_to(
+        StringMapValue[StringValue], context=context
+    )
+    assert empty_map == {}
+
+
 @pytest.mark.unit
 async def test_string_map_value(context):
     """Test StringMapValue functionality."""
@@ -205,6 +248,19 @@ async def test_cast_cache(context):
     str_val2 = await int_val.cast_to(StringValue, context=context)
     assert str_val2 is str_val1  # Should be the same object from cache
 
+    # Casts to other types are cached alongside the first one
+    float_val1 = await int_val.cast_to(FloatValue, context=context)
+    assert await int_val.cast_to(FloatValue, context=context) is float_val1
+    assert await int_val.cast_to(StringValue, context=context) is str_val1
+
+
+@pytest.mark.unit
+def test_value_has_no_private_dict():
+    """Test that values don't allocate per-instance private attribute storage."""
+    assert IntegerValue(42).__pydantic_private__ is None
+    sequence = SequenceValue[IntegerValue]([IntegerValue(1), IntegerValue(2)])
+    assert sequence.__pydantic_private__ is None
+
 
 @pytest.mark.unit
 async def test_invalid_casting(context):
@@ -227,6 +283,10 @@ async def test_self_casting(context):
     same_val = await int_val.cast_to(IntegerValue, context=context)
     assert same_val is int_val
 
+    # even when a caster to the same type is inherited from a parent class
+    str_val = StringValue("hello")
+    assert await str_val.cast_to(StringValue, context=context) is str_val
+
 
 @pytest.mark.unit
 def test_get_origin_and_args():
@@ -253,6 +313,30 @@ def test_get_value_type_key():
     assert result == ("SequenceValue", (("IntegerValue", ()),))
 
 
+@pytest.mark.unit
+def test_value_type_key_cached_per_class():
+    """Test that type keys are cached on the class without leaking to subclasses."""
+    key = get_value_type_key(SequenceValue[IntegerValue])
+    assert get_value_type_key(SequenceValue[IntegerValue]) is key
+
+    class CustomIntegerValue(IntegerValue):
+        pass
+
+    assert get_value_type_key(IntegerValue) == ("IntegerValue", ())
+    assert get_value_type_key(CustomIntegerValue) == ("CustomIntegerValue", ())
+    assert get_origin_and_args(CustomIntegerValue) == (CustomIntegerValue, ())
+
+
+@pytest.mark.unit
+def test_parametrize():
+    """Test that parametrize returns the same class as subscripting."""
+    assert parametrize(SequenceValue, IntegerValue) is SequenceValue[IntegerValue]
+    assert parametrize(SequenceValue, IntegerValue) is parametrize(
+        SequenceValue, IntegerValue
+    )
+    assert parametrize(StringMapValue, StringValue) is StringMapValue[StringValue]
+
+
 @pytest.mark.unit
 def test_value_frozen_behavior():
     """Test that Value objects are frozen (immutable)."""
@@ -331,6 +415,52 @@ async def test_cast_registration(context):
             return AnswerValue(42)
 
 
+@pytest.mark.unit
+def test_casters_inherited_and_locked():
+    """Test that casters are inherited, and that resolving them locks the parents."""
+
+    class ParentValue(Value[int]):
+        pass
+
+    class ChildValue(ParentValue):
+        pass
+
+    @ParentValue.register_cast_to(IntegerValue)
+    def cast_parent_to_integer(value: ParentValue, context: Context) -> IntegerValue:
+        return IntegerValue(value.root)
+
+    assert ChildValue.can_cast_to(IntegerValue)
+
+    with pytest.raises(RuntimeError, match="Cannot add casters for ParentValue"):
+
+        @ParentValue.register_cast_to(FloatValue)
+        def cast_parent_to_float(value: ParentValue, context: Context) -> FloatValue:
+            return FloatValue(value.root)
+
+    with pytest.raises(TypeError):
+        ChildValue._get_casters()[FloatValue] = cast_parent_to_integer  # type: ignore
+
+
+@pytest.mark.unit
+def test_get_caster_cached():
+    """Test that realized casters are cached per target type."""
+    caster = IntegerValue.get_caster(FloatValue)
+    assert caster is not None
+    assert IntegerValue.get_caster(FloatValue) is caster
+
+    caster = SequenceValue[IntegerValue].get_caster(SequenceValue[FloatValue])
+    assert caster is not None
+    assert SequenceValue[IntegerValue].get_caster(SequenceValue[FloatValue]) is caster
+
+    assert not SequenceValue[IntegerValue].can_cast_to(StringMapValue[IntegerValue])
+    assert not SequenceValue[IntegerValue].can_cast_to(StringMapValue[IntegerValue])
+
+    # casting to the same type is always the identity
+    identity = IntegerValue.get_caster(IntegerValue)
+    assert identity is not None
+    assert StringValue.get_caster(StringValue) is identity
+
+
 @pytest.mark.unit
 def test_json_parsing_edge_cases():
     """Test JSON parsing edge cases."""